@@ -22,11 +22,17 @@ Priority Order (P0-P6):
 """
 
 import sys
+import os
 import subprocess
 import argparse
+import asyncio
 import json
+import threading
+from collections import deque
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, NamedTuple, Optional, Dict, Any
 from datetime import datetime
 
 # ANSI colors for terminal output
@@ -41,6 +47,21 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# Prefix strings built once instead of re-concatenated on every call; they
+# collapse to plain text when stdout is not a TTY or NO_COLOR is set, which
+# also keeps piped logs free of escape codes
+if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+    for _attr in list(vars(Colors)):
+        if not _attr.startswith('__'):
+            setattr(Colors, _attr, '')
+
+_OK_PREFIX = f"{Colors.GREEN}✅ "
+_WARN_PREFIX = f"{Colors.YELLOW}⚠️  "
+_ERR_PREFIX = f"{Colors.RED}❌ "
+_END = Colors.ENDC
+_STEP_PREFIX = f"{Colors.BOLD}{Colors.BLUE}🔄 "
+
+
 def print_header(text: str):
     print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.ENDC}")
     print(f"{Colors.BOLD}{Colors.CYAN}{text.center(60)}{Colors.ENDC}")
@@ -48,169 +69,461 @@ def print_header(text: str):
 
 
 def print_step(text: str):
-    print(f"{Colors.BOLD}{Colors.BLUE}🔄 {text}{Colors.ENDC}")
+    print(_STEP_PREFIX, text, _END, sep="")
 
 
 def print_success(text: str):
-    print(f"{Colors.GREEN}✅ {text}{Colors.ENDC}")
+    print(_OK_PREFIX, text, _END, sep="")
 
 
 def print_warning(text: str):
-    print(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}")
+    print(_WARN_PREFIX, text, _END, sep="")
 
 
 def print_error(text: str):
-    print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
-
-
-# Define skill-based checks - maps to AGT-Kit skills
-CORE_CHECKS = [
-    {
-        "name": "Security Scan",
-        "skill": "security-fundamentals",
-        "script": ".agent/skills/security-fundamentals/scripts/security_scan.py",
-        "priority": 0,
-        "required": True,
-    },
-    {
-        "name": "Lint Check",
-        "skill": "clean-code",
-        "script": ".agent/skills/clean-code/scripts/lint_runner.py",
-        "priority": 1,
-        "required": True,
-    },
-    {
-        "name": "Schema Validation",
-        "skill": "database-design",
-        "script": ".agent/skills/database-design/scripts/schema_validator.py",
-        "priority": 2,
-        "required": False,
-    },
-    {
-        "name": "Test Runner",
-        "skill": "testing-patterns",
-        "script": ".agent/skills/testing-patterns/scripts/test_runner.py",
-        "priority": 3,
-        "required": False,
-    },
-    {
-        "name": "UX Audit",
-        "skill": "frontend-design",
-        "script": ".agent/skills/frontend-design/scripts/ux_audit.py",
-        "priority": 4,
-        "required": False,
-    },
-    {
-        "name": "SEO Check",
-        "skill": "seo-patterns",
-        "script": ".agent/skills/seo-patterns/scripts/seo_checker.py",
-        "priority": 5,
-        "required": False,
-    },
-]
-
-PERFORMANCE_CHECKS = [
-    {
-        "name": "Lighthouse Audit",
-        "skill": "performance-profiling",
-        "script": ".agent/skills/performance-profiling/scripts/lighthouse_audit.py",
-        "priority": 6,
-        "required": False,
-        "needs_url": True,
-    },
-    {
-        "name": "E2E Tests",
-        "skill": "e2e-testing",
-        "script": ".agent/skills/e2e-testing/scripts/playwright_runner.py",
-        "priority": 7,
-        "required": False,
-        "needs_url": True,
-    },
-]
+    print(_ERR_PREFIX, text, _END, sep="")
+
+
+class Check(NamedTuple):
+    """One checklist entry; immutable so the tables stay shared constants."""
+    name: str
+    skill: str
+    script: str
+    priority: int
+    required: bool
+    needs_url: bool = False
+    pipe_to: Optional[str] = None  # name of a check fed by this one's stdout
+
+
+# Define skill-based checks - maps to AGT-Kit skills.
+# Presorted by priority once at import so runs never re-sort.
+CORE_CHECKS = tuple(sorted((
+    Check(
+        name="Security Scan",
+        skill="security-fundamentals",
+        script=".agent/skills/security-fundamentals/scripts/security_scan.py",
+        priority=0,
+        required=True,
+    ),
+    Check(
+        name="Lint Check",
+        skill="clean-code",
+        script=".agent/skills/clean-code/scripts/lint_runner.py",
+        priority=1,
+        required=True,
+    ),
+    Check(
+        name="Schema Validation",
+        skill="database-design",
+        script=".agent/skills/database-design/scripts/schema_validator.py",
+        priority=2,
+        required=False,
+    ),
+    Check(
+        name="Test Runner",
+        skill="testing-patterns",
+        script=".agent/skills/testing-patterns/scripts/test_runner.py",
+        priority=3,
+        required=False,
+    ),
+    Check(
+        name="UX Audit",
+        skill="frontend-design",
+        script=".agent/skills/frontend-design/scripts/ux_audit.py",
+        priority=4,
+        required=False,
+    ),
+    Check(
+        name="SEO Check",
+        skill="seo-patterns",
+        script=".agent/skills/seo-patterns/scripts/seo_checker.py",
+        priority=5,
+        required=False,
+    ),
+), key=attrgetter("priority")))
+
+PERFORMANCE_CHECKS = tuple(sorted((
+    Check(
+        name="Lighthouse Audit",
+        skill="performance-profiling",
+        script=".agent/skills/performance-profiling/scripts/lighthouse_audit.py",
+        priority=6,
+        required=False,
+        needs_url=True,
+    ),
+    Check(
+        name="E2E Tests",
+        skill="e2e-testing",
+        script=".agent/skills/e2e-testing/scripts/playwright_runner.py",
+        priority=7,
+        required=False,
+        needs_url=True,
+    ),
+), key=attrgetter("priority")))
 
 QUICK_CHECKS = ["Security Scan", "Lint Check", "Test Runner"]
 
 
 def detect_project_type(project_path: Path) -> str:
     """Detect project type to filter relevant checks."""
-    if (project_path / "package.json").exists():
-        pkg = json.loads((project_path / "package.json").read_text())
-        deps = {**pkg.get("dependencies", {}), **pkg.get("devDependencies", {})}
+    return _detect_project_type(str(project_path))
+
+
+@lru_cache(maxsize=8)
+def _detect_project_type(project_path: str) -> str:
+    root = Path(project_path)
+    pkg_json = root / "package.json"
+    
+    if pkg_json.exists():
+        # A byte-level substring scan is enough to pick a framework and
+        # skips building a dict tree out of potentially huge package.json
+        try:
+            raw = pkg_json.read_bytes()
+        except OSError:
+            raw = b""
         
-        if "next" in deps:
+        if b'"next"' in raw:
             return "nextjs"
-        if "react" in deps:
+        if b'"react"' in raw:
             return "react"
-        if "express" in deps or "fastify" in deps:
+        if b'"express"' in raw or b'"fastify"' in raw:
             return "node-backend"
         return "node"
     
-    if (project_path / "pyproject.toml").exists() or (project_path / "requirements.txt").exists():
+    if (root / "pyproject.toml").exists() or (root / "requirements.txt").exists():
         return "python"
     
-    if (project_path / "pubspec.yaml").exists():
+    if (root / "pubspec.yaml").exists():
         return "flutter"
     
-    if (project_path / "go.mod").exists():
+    if (root / "go.mod").exists():
         return "go"
     
     return "unknown"
 
 
-def run_script(check: Dict[str, Any], project_path: Path, url: Optional[str] = None) -> Dict[str, Any]:
-    """Run a validation script and capture results."""
-    script_path = project_path / check["script"]
-    
-    if not script_path.exists():
-        print_warning(f"{check['name']}: Script not found ({check['skill']} skill)")
+def scan_known_scripts(project_path: Path) -> set:
+    """Collect relative paths of every skill script in one directory walk.
+
+    Set membership then replaces the per-check stat probe in run_script:
+    one scandir pass amortized over all checks instead of N syscalls.
+    """
+    known = set()
+    base = project_path / ".agent" / "skills"
+    try:
+        with os.scandir(base) as it:
+            skill_dirs = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+    except OSError:
+        return known
+
+    for skill_dir in skill_dirs:
+        try:
+            with os.scandir(os.path.join(skill_dir, "scripts")) as scripts:
+                for entry in scripts:
+                    if entry.name.endswith(".py") and entry.is_file():
+                        known.add(os.path.relpath(entry.path, project_path))
+        except OSError:
+            continue
+    return known
+
+
+def _script_missing(check: Check, project_path: Path, known: Optional[set]) -> bool:
+    if known is not None:
+        return check.script not in known
+    return not (project_path / check.script).exists()
+
+
+def run_script(check: Check, project_path: Path, url: Optional[str] = None,
+               known: Optional[set] = None) -> Dict[str, Any]:
+    """Run a validation script and capture results.
+
+    Does not print — checks run concurrently, so status reporting happens
+    on the main thread (see report_result) to keep output unscrambled.
+    """
+    script_path = project_path / check.script
+
+    if _script_missing(check, project_path, known):
         return {
-            "name": check["name"],
-            "skill": check["skill"],
+            "name": check.name,
+            "skill": check.skill,
             "passed": True,
             "skipped": True,
             "reason": "Script not found"
         }
-    
-    print_step(f"Running: {check['name']} ({check['skill']})")
-    
+
     # Build command
     cmd = ["python", str(script_path), str(project_path)]
-    if url and check.get("needs_url"):
+    if url and check.needs_url:
         cmd.append(url)
-    
+
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
-        
-        passed = result.returncode == 0
-        
-        if passed:
-            print_success(f"{check['name']}: PASSED")
-        else:
-            print_error(f"{check['name']}: FAILED")
-            if result.stderr:
-                print(f"  Error: {result.stderr[:200]}")
-        
+        # Stream child output through bounded tail buffers instead of
+        # capture_output, which holds the child's entire stdout in memory;
+        # only the tail ever mattered since the result was sliced anyway
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE, text=True)
+        out_tail: deque = deque(maxlen=40)
+        err_tail: deque = deque(maxlen=15)
+
+        def _drain(stream, tail):
+            for line in stream:
+                tail.append(line)
+            stream.close()
+
+        readers = [
+            threading.Thread(target=_drain, args=(proc.stdout, out_tail), daemon=True),
+            threading.Thread(target=_drain, args=(proc.stderr, err_tail), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        try:
+            proc.wait(timeout=300)  # 5 minute timeout
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        for reader in readers:
+            reader.join()
+
+        passed = proc.returncode == 0
+        stdout_tail = "".join(out_tail)
+        stderr_tail = "".join(err_tail)
+
         return {
-            "name": check["name"],
-            "skill": check["skill"],
+            "name": check.name,
+            "skill": check.skill,
             "passed": passed,
-            "output": result.stdout[:2000] if result.stdout else "",
-            "error": result.stderr[:500] if result.stderr else "",
+            "output": stdout_tail[:2000],
+            "error": stderr_tail[:500],
             "skipped": False
         }
     
     except subprocess.TimeoutExpired:
-        print_error(f"{check['name']}: TIMEOUT (>5 minutes)")
-        return {"name": check["name"], "skill": check["skill"], "passed": False, "skipped": False, "error": "Timeout"}
-    
+        return {"name": check.name, "skill": check.skill, "passed": False, "skipped": False, "error": "Timeout"}
+
+    except Exception as e:
+        return {"name": check.name, "skill": check.skill, "passed": False, "skipped": False, "error": str(e)}
+
+
+async def run_script_async(check: Check, project_path: Path,
+                           url: Optional[str] = None,
+                           known: Optional[set] = None) -> Dict[str, Any]:
+    """Async variant of run_script driven by the orchestration event loop.
+
+    Network-bound checks (Lighthouse, Playwright) spend their time waiting,
+    so one event loop overlaps all of them without per-check threads. Output
+    is drained into the same bounded tail buffers as the sync path.
+    """
+    script_path = project_path / check.script
+
+    if _script_missing(check, project_path, known):
+        return {
+            "name": check.name,
+            "skill": check.skill,
+            "passed": True,
+            "skipped": True,
+            "reason": "Script not found"
+        }
+
+    cmd = ["python", str(script_path), str(project_path)]
+    if url and check.needs_url:
+        cmd.append(url)
+
+    out_tail: deque = deque(maxlen=40)
+    err_tail: deque = deque(maxlen=15)
+
+    async def _drain(stream, tail):
+        while True:
+            line = await stream.readline()
+            if not line:
+                return
+            tail.append(line.decode(errors="replace"))
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        drains = asyncio.gather(_drain(proc.stdout, out_tail),
+                                _drain(proc.stderr, err_tail))
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=300)  # 5 minute timeout
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            drains.cancel()
+            return {"name": check.name, "skill": check.skill,
+                    "passed": False, "skipped": False, "error": "Timeout"}
+        await drains
+
+        return {
+            "name": check.name,
+            "skill": check.skill,
+            "passed": proc.returncode == 0,
+            "output": "".join(out_tail)[:2000],
+            "error": "".join(err_tail)[:500],
+            "skipped": False
+        }
+
+    except Exception as e:
+        return {"name": check.name, "skill": check.skill,
+                "passed": False, "skipped": False, "error": str(e)}
+
+
+def run_pipeline(chain: List[Check], project_path: Path,
+                 url: Optional[str] = None,
+                 known: Optional[set] = None) -> List[Dict[str, Any]]:
+    """Run a chain of checks as one subprocess pipeline.
+
+    Each stage's stdout feeds the next stage's stdin through a kernel pipe
+    buffer, so the parent never materializes the intermediate data. Only
+    checks marked with "pipe_to" participate; everything else stays on the
+    parallel path. Output is captured from the final stage only, and
+    intermediate stderr is discarded to keep concurrent reporting clean.
+    """
+    # A missing script breaks the chain — fall back to independent runs
+    if any(_script_missing(check, project_path, known) for check in chain):
+        return [run_script(check, project_path, url, known) for check in chain]
+
+    procs: List[subprocess.Popen] = []
+    prev_stdout = None
+    try:
+        for i, check in enumerate(chain):
+            cmd = ["python", str(project_path / check.script), str(project_path)]
+            if url and check.needs_url:
+                cmd.append(url)
+            last = (i == len(chain) - 1)
+            proc = subprocess.Popen(
+                cmd,
+                stdin=prev_stdout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE if last else subprocess.DEVNULL,
+                text=True,
+            )
+            # Close the parent's copy so upstream stages see EPIPE if a
+            # downstream stage dies (the POSIX pipeline idiom)
+            if prev_stdout is not None:
+                prev_stdout.close()
+            prev_stdout = proc.stdout
+            procs.append(proc)
+
+        stdout, stderr = procs[-1].communicate(timeout=300)
+        for proc in procs[:-1]:
+            proc.wait(timeout=300)
+    except subprocess.TimeoutExpired:
+        for proc in procs:
+            proc.kill()
+        return [{"name": c.name, "skill": c.skill, "passed": False,
+                 "skipped": False, "error": "Timeout"} for c in chain]
     except Exception as e:
-        print_error(f"{check['name']}: ERROR - {str(e)}")
-        return {"name": check["name"], "skill": check["skill"], "passed": False, "skipped": False, "error": str(e)}
+        for proc in procs:
+            proc.kill()
+        return [{"name": c.name, "skill": c.skill, "passed": False,
+                 "skipped": False, "error": str(e)} for c in chain]
+
+    results = []
+    for check, proc in zip(chain, procs):
+        result = {
+            "name": check.name,
+            "skill": check.skill,
+            "passed": proc.returncode == 0,
+            "skipped": False,
+        }
+        if proc is procs[-1]:
+            result["output"] = stdout[:2000]
+            result["error"] = stderr[:500]
+        results.append(result)
+    return results
+
+
+def _build_chains(checks: List[Check]) -> List[List[Check]]:
+    """Group checks into pipeline chains via their "pipe_to" keys.
+
+    Checks without "pipe_to" (and not targeted by one) come back as
+    single-element chains and run independently.
+    """
+    by_name = {check.name: check for check in checks}
+    downstream = {check.pipe_to for check in checks if check.pipe_to}
+
+    chains = []
+    for check in checks:
+        if check.name in downstream:
+            continue  # reached through its upstream chain head
+        chain = [check]
+        while chain[-1].pipe_to in by_name:
+            chain.append(by_name[chain[-1].pipe_to])
+        chains.append(chain)
+    return chains
+
+
+def report_result(check: Check, result: Dict[str, Any]):
+    """Print one check's status from the main thread."""
+    if result.get("skipped"):
+        print_warning(f"{check.name}: Script not found ({check.skill} skill)")
+    elif result["passed"]:
+        print_success(f"{check.name}: PASSED")
+    else:
+        if result.get("error") == "Timeout":
+            print_error(f"{check.name}: TIMEOUT (>5 minutes)")
+        else:
+            print_error(f"{check.name}: FAILED")
+            if result.get("error"):
+                print(f"  Error: {result['error'][:200]}")
+
+
+async def _run_checks_async(checks: List[Check], project_path: Path,
+                            url: Optional[str], stop_on_fail: bool,
+                            jobs: Optional[int],
+                            known: Optional[set]) -> (List[Dict], bool):
+    results = []
+    stopped = False
+    chains = _build_chains(checks)
+    sem = asyncio.Semaphore(jobs or min(8, len(chains) or 1))
+
+    async def _run_chain(chain):
+        async with sem:
+            if len(chain) == 1:
+                return chain, [await run_script_async(chain[0], project_path, url, known)]
+            # Pipelines keep the blocking Popen chain; a worker thread drives it
+            return chain, await asyncio.to_thread(run_pipeline, chain, project_path,
+                                                  url, known)
+
+    tasks = [asyncio.create_task(_run_chain(chain)) for chain in chains]
+    for coro in asyncio.as_completed(tasks):
+        chain, chain_results = await coro
+
+        for check, result in zip(chain, chain_results):
+            results.append(result)
+            report_result(check, result)
+
+            # Stop on critical failure if flag set; sibling tasks are
+            # cancelled, already-running ones finish but are not reported
+            if stop_on_fail and check.required and not result["passed"] and not result.get("skipped"):
+                print_error(f"CRITICAL: {check.name} failed. Stopping.")
+                for task in tasks:
+                    task.cancel()
+                stopped = True
+        if stopped:
+            break
+
+    return results, stopped
+
+
+def run_checks_parallel(checks: List[Check], project_path: Path,
+                        url: Optional[str] = None, stop_on_fail: bool = False,
+                        jobs: Optional[int] = None,
+                        known: Optional[set] = None) -> (List[Dict], bool):
+    """Run independent checks concurrently and report as they finish.
+
+    A single event loop drives all child processes — the waiting is
+    network and pipe I/O, so wall time approaches the slowest check
+    instead of the sum with no per-check thread overhead. Checks linked
+    with "pipe_to" run as one subprocess pipeline (see run_pipeline)
+    occupying a single slot.
+    """
+    return asyncio.run(_run_checks_async(checks, project_path, url,
+                                         stop_on_fail, jobs, known))
 
 
 def print_summary(results: List[Dict], project_type: str) -> bool:
@@ -265,6 +578,7 @@ Examples:
     parser.add_argument("--url", help="URL for performance checks (Lighthouse, Playwright)")
     parser.add_argument("--quick", action="store_true", help="Run only quick checks (Security, Lint, Tests)")
     parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first critical failure")
+    parser.add_argument("--jobs", type=int, default=None, help="Max concurrent checks (default: auto)")
     
     args = parser.parse_args()
     
@@ -282,33 +596,31 @@ Examples:
     print(f"URL: {args.url if args.url else 'Not provided'}")
     print(f"Mode: {'Quick' if args.quick else 'Full'}")
     
-    results = []
-    
     # Filter checks based on --quick flag
-    checks_to_run = CORE_CHECKS.copy()
+    checks_to_run = list(CORE_CHECKS)
     if args.quick:
-        checks_to_run = [c for c in checks_to_run if c["name"] in QUICK_CHECKS]
-    
-    # Run core checks
-    print_header("📋 CORE CHECKS")
-    for check in sorted(checks_to_run, key=lambda x: x["priority"]):
-        result = run_script(check, project_path)
-        results.append(result)
-        
-        # Stop on critical failure if flag set
-        if args.stop_on_fail and check["required"] and not result["passed"] and not result.get("skipped"):
-            print_error(f"CRITICAL: {check['name']} failed. Stopping.")
-            print_summary(results, project_type)
-            sys.exit(1)
-    
-    # Run performance checks if URL provided
-    if args.url and not args.quick:
-        print_header("⚡ PERFORMANCE CHECKS")
-        for check in PERFORMANCE_CHECKS:
-            result = run_script(check, project_path, args.url)
-            results.append(result)
-    
-    # Print summary
+        checks_to_run = [c for c in checks_to_run if c.name in QUICK_CHECKS]
+
+    # Run everything in one event loop so the URL-gated performance checks
+    # overlap the core checks instead of waiting for them; the tables are
+    # already priority-sorted and the summary restores that order
+    run_perf = bool(args.url) and not args.quick
+    if run_perf:
+        print_header("📋 CORE + PERFORMANCE CHECKS")
+        checks_to_run = checks_to_run + list(PERFORMANCE_CHECKS)
+    else:
+        print_header("📋 CORE CHECKS")
+    known_scripts = scan_known_scripts(project_path)
+    results, stopped = run_checks_parallel(checks_to_run, project_path, args.url,
+                                           stop_on_fail=args.stop_on_fail,
+                                           jobs=args.jobs, known=known_scripts)
+    if stopped:
+        print_summary(results, project_type)
+        sys.exit(1)
+
+    # Print summary in priority order regardless of completion order
+    order = {c.name: c.priority for c in CORE_CHECKS + PERFORMANCE_CHECKS}
+    results.sort(key=lambda r: order.get(r["name"], 99))
     all_passed = print_summary(results, project_type)
     
     sys.exit(0 if all_passed else 1)
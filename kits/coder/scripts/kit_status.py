@@ -17,11 +17,35 @@ Usage:
 
 import sys
 import argparse
+import atexit
 import json
+import os
 import re
 from pathlib import Path
 from typing import Dict, List, Any
 
+# orjson serializes in C when installed; stdlib pretty-printing is the
+# slow path but keeps the script dependency-free
+try:
+    import orjson
+
+    def _dump_json(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dump_json(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+# PyYAML handles list values, quoted colons and multi-line strings that the
+# line-split fallback below cannot; CSafeLoader parses in C via libyaml
+try:
+    import yaml
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
+except ImportError:
+    yaml = None
+
 # ANSI colors
 class Colors:
     HEADER = '\033[95m'
@@ -34,6 +58,20 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# Prefix strings built once instead of re-concatenated on every call; they
+# collapse to plain text when stdout is not a TTY or NO_COLOR is set, which
+# also keeps piped logs free of escape codes
+if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+    for _attr in list(vars(Colors)):
+        if not _attr.startswith('__'):
+            setattr(Colors, _attr, '')
+
+_OK_PREFIX = f"{Colors.GREEN}✅ "
+_WARN_PREFIX = f"{Colors.YELLOW}⚠️  "
+_ERR_PREFIX = f"{Colors.RED}❌ "
+_END = Colors.ENDC
+
+
 def print_header(text: str):
     print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.ENDC}")
     print(f"{Colors.BOLD}{Colors.CYAN}{text.center(60)}{Colors.ENDC}")
@@ -41,15 +79,15 @@ def print_header(text: str):
 
 
 def print_success(text: str):
-    print(f"{Colors.GREEN}✅ {text}{Colors.ENDC}")
+    print(_OK_PREFIX, text, _END, sep="")
 
 
 def print_warning(text: str):
-    print(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}")
+    print(_WARN_PREFIX, text, _END, sep="")
 
 
 def print_error(text: str):
-    print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
+    print(_ERR_PREFIX, text, _END, sep="")
 
 
 def find_kit_root() -> Path:
@@ -61,24 +99,37 @@ def find_kit_root() -> Path:
     if (agent_dir / "ARCHITECTURE.md").exists():
         return agent_dir
     
-    # Try from current working directory
-    cwd = Path.cwd()
-    for parent in [cwd, *cwd.parents]:
-        agent_dir = parent / ".agent"
-        if agent_dir.exists() and (agent_dir / "ARCHITECTURE.md").exists():
-            return agent_dir
-    
-    return None
+    # Walk ancestors with plain strings: one stat per level (the
+    # ARCHITECTURE.md probe covers the .agent check) and no Path churn
+    cwd = os.getcwd()
+    while True:
+        try:
+            os.stat(os.path.join(cwd, ".agent", "ARCHITECTURE.md"))
+            return Path(cwd) / ".agent"
+        except OSError:
+            pass
+        parent = os.path.dirname(cwd)
+        if parent == cwd:
+            return None
+        cwd = parent
 
 
 def parse_frontmatter(file_path: Path) -> Dict[str, Any]:
-    """Parse YAML frontmatter from a markdown file."""
+    """Parse YAML frontmatter from a markdown file.
+
+    Only the first 2KB is read — the frontmatter block always sits at the
+    top of the file, so the body never needs to come off disk.
+    """
     try:
-        content = file_path.read_text()
+        with open(file_path, 'rb') as f:
+            content = f.read(2048).decode('utf-8', 'replace')
         if content.startswith('---'):
             parts = content.split('---', 2)
             if len(parts) >= 3:
                 frontmatter = parts[1].strip()
+                if yaml is not None:
+                    data = yaml.load(frontmatter, Loader=_YamlLoader)
+                    return data if isinstance(data, dict) else {}
                 result = {}
                 for line in frontmatter.split('\n'):
                     if ':' in line:
@@ -90,6 +141,52 @@ def parse_frontmatter(file_path: Path) -> Dict[str, Any]:
     return {}
 
 
+# On-disk frontmatter cache: warm runs cost one stat per markdown file
+# instead of a full read + parse
+_FM_CACHE_FILE = Path(__file__).parent.parent / ".cache" / "frontmatter.json"
+_fm_cache: Dict[str, Any] = {}
+_fm_cache_loaded = False
+_fm_cache_dirty = False
+
+
+def cached_frontmatter(file_path: Path) -> Dict[str, Any]:
+    """Parse frontmatter with an on-disk cache keyed by (path, mtime, size)."""
+    global _fm_cache_loaded, _fm_cache_dirty
+    try:
+        st = file_path.stat()
+    except OSError:
+        return {}
+    key = f"{file_path}:{st.st_mtime_ns}:{st.st_size}"
+
+    if not _fm_cache_loaded:
+        _fm_cache_loaded = True
+        try:
+            _fm_cache.update(json.loads(_FM_CACHE_FILE.read_text()))
+        except (OSError, ValueError):
+            pass
+
+    hit = _fm_cache.get(key)
+    if hit is not None:
+        return hit
+
+    result = parse_frontmatter(file_path)
+    _fm_cache[key] = result
+    _fm_cache_dirty = True
+    return result
+
+
+def _flush_fm_cache():
+    if _fm_cache_dirty:
+        try:
+            _FM_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _FM_CACHE_FILE.write_text(json.dumps(_fm_cache))
+        except OSError:
+            pass
+
+
+atexit.register(_flush_fm_cache)
+
+
 def parse_skills_from_architecture(agent_dir: Path) -> Dict[str, List[str]]:
     """Parse agent-skill mappings from ARCHITECTURE.md tables.
     
@@ -142,7 +239,7 @@ def get_agents(agent_dir: Path) -> List[Dict[str, Any]]:
     arch_skills = parse_skills_from_architecture(agent_dir)
     
     for agent_file in agents_path.glob("*.md"):
-        frontmatter = parse_frontmatter(agent_file)
+        frontmatter = cached_frontmatter(agent_file)
         skills = arch_skills.get(agent_file.stem, [])
         
         agents.append({
@@ -155,6 +252,15 @@ def get_agents(agent_dir: Path) -> List[Dict[str, Any]]:
     return sorted(agents, key=lambda x: x["name"])
 
 
+def _has_py_scripts(scripts_path: str) -> bool:
+    """True if the directory holds at least one .py file (first hit wins)."""
+    try:
+        with os.scandir(scripts_path) as it:
+            return any(e.name.endswith(".py") and e.is_file() for e in it)
+    except OSError:
+        return False
+
+
 def get_skills(agent_dir: Path) -> List[Dict[str, Any]]:
     """Get list of skills with their metadata."""
     skills = []
@@ -163,25 +269,21 @@ def get_skills(agent_dir: Path) -> List[Dict[str, Any]]:
     if not skills_path.exists():
         return skills
     
-    for skill_dir in skills_path.iterdir():
-        if not skill_dir.is_dir():
-            continue
-        
-        skill_md = skill_dir / "SKILL.md"
+    with os.scandir(skills_path) as it:
+        entries = [e for e in it if e.is_dir(follow_symlinks=False)]
+
+    for entry in entries:
+        skill_md = Path(entry.path) / "SKILL.md"
         if not skill_md.exists():
             continue
-        
-        frontmatter = parse_frontmatter(skill_md)
-        
-        # Check for scripts
-        scripts_path = skill_dir / "scripts"
-        has_scripts = scripts_path.exists() and any(scripts_path.glob("*.py"))
-        
+
+        frontmatter = cached_frontmatter(skill_md)
+
         skills.append({
-            "name": skill_dir.name,
+            "name": entry.name,
             "file": str(skill_md.relative_to(agent_dir)),
             "description": frontmatter.get("description", ""),
-            "has_scripts": has_scripts,
+            "has_scripts": _has_py_scripts(os.path.join(entry.path, "scripts")),
         })
     
     return sorted(skills, key=lambda x: x["name"])
@@ -203,7 +305,7 @@ def get_workflows(agent_dir: Path) -> List[Dict[str, Any]]:
             continue
         
         for workflow_file in workflows_path.glob("*.md"):
-            frontmatter = parse_frontmatter(workflow_file)
+            frontmatter = cached_frontmatter(workflow_file)
             
             workflows.append({
                 "name": workflow_file.stem,
@@ -334,7 +436,10 @@ def main():
             "workflows": workflows,
             "validation": validation,
         }
-        print(json.dumps(output, indent=2))
+        sys.stdout.flush()
+        sys.stdout.buffer.write(_dump_json(output))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
     else:
         print_report(agents, skills, workflows, validation)
     
@@ -8,8 +8,8 @@ Enable/disable skills without deleting them.
 Usage:
     python3 .agent/scripts/skills_manager.py list          # List active skills
     python3 .agent/scripts/skills_manager.py disabled      # List disabled skills
-    python3 .agent/scripts/skills_manager.py enable SKILL  # Enable a skill
-    python3 .agent/scripts/skills_manager.py disable SKILL # Disable a skill
+    python3 .agent/scripts/skills_manager.py enable SKILL [SKILL...]   # Enable skills
+    python3 .agent/scripts/skills_manager.py disable SKILL [SKILL...]  # Disable skills
     python3 .agent/scripts/skills_manager.py search QUERY  # Search skills
     python3 .agent/scripts/skills_manager.py info SKILL    # Show skill details
 """
@@ -17,8 +17,23 @@ Usage:
 import sys
 import os
 import re
+import shutil
+import json
+import atexit
+from dataclasses import dataclass
 from pathlib import Path
 
+# PyYAML handles list values, quoted colons and multi-line strings that the
+# line-split fallback below cannot; CSafeLoader parses in C via libyaml
+try:
+    import yaml
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
+except ImportError:
+    yaml = None
+
 # Fix console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -31,13 +46,23 @@ AGENT_DIR = SCRIPT_DIR.parent
 SKILLS_DIR = AGENT_DIR / "skills"
 DISABLED_DIR = SKILLS_DIR / ".disabled"
 
+# Compiled once: parse_frontmatter runs for every skill during list/search
+_FM_RE = re.compile(r'^---\s*\n(.*?)\n---', re.DOTALL)
+
 
 def parse_frontmatter(content: str) -> dict:
     """Parse YAML frontmatter from SKILL.md."""
-    fm_match = re.search(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
+    fm_match = _FM_RE.search(content)
     if not fm_match:
         return {}
     
+    if yaml is not None:
+        try:
+            data = yaml.load(fm_match.group(1), Loader=_YamlLoader)
+            return data if isinstance(data, dict) else {}
+        except yaml.YAMLError:
+            return {}
+    
     metadata = {}
     for line in fm_match.group(1).split('\n'):
         if ':' in line:
@@ -46,44 +71,123 @@ def parse_frontmatter(content: str) -> dict:
     return metadata
 
 
-def get_skill_info(skill_path: Path) -> dict:
-    """Get information about a skill."""
-    skill_md = skill_path / "SKILL.md"
-    info = {
-        "name": skill_path.name,
-        "path": str(skill_path),
-        "has_skill_md": skill_md.exists(),
-        "has_scripts": (skill_path / "scripts").exists(),
-        "description": "",
-    }
-    
-    if skill_md.exists():
+# On-disk frontmatter cache shared with kit_status.py: warm runs cost one
+# stat per SKILL.md instead of a full read + parse
+_FM_CACHE_FILE = AGENT_DIR / ".cache" / "frontmatter.json"
+_fm_cache = {}
+_fm_cache_loaded = False
+_fm_cache_dirty = False
+
+
+def cached_frontmatter(file_path: Path) -> dict:
+    """Parse frontmatter with an on-disk cache keyed by (path, mtime, size)."""
+    global _fm_cache_loaded, _fm_cache_dirty
+    try:
+        st = file_path.stat()
+    except OSError:
+        return {}
+    key = f"{file_path}:{st.st_mtime_ns}:{st.st_size}"
+
+    if not _fm_cache_loaded:
+        _fm_cache_loaded = True
         try:
-            content = skill_md.read_text(encoding='utf-8')
-            metadata = parse_frontmatter(content)
-            info["description"] = metadata.get("description", "")[:80]
-        except:
+            _fm_cache.update(json.loads(_FM_CACHE_FILE.read_text()))
+        except (OSError, ValueError):
             pass
-    
-    return info
+
+    hit = _fm_cache.get(key)
+    if hit is not None:
+        return hit
+
+    # The frontmatter block always sits at the top, so 2KB is enough and
+    # the body never needs to come off disk
+    try:
+        with open(file_path, 'rb') as f:
+            result = parse_frontmatter(f.read(2048).decode('utf-8', 'replace'))
+    except OSError:
+        return {}
+    _fm_cache[key] = result
+    _fm_cache_dirty = True
+    return result
+
+
+def _flush_fm_cache():
+    if _fm_cache_dirty:
+        try:
+            _FM_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _FM_CACHE_FILE.write_text(json.dumps(_fm_cache))
+        except OSError:
+            pass
+
+
+atexit.register(_flush_fm_cache)
+
+
+@dataclass(slots=True)
+class SkillInfo:
+    name: str
+    path: str
+    has_skill_md: bool
+    has_scripts: bool
+    description: str
+
+
+_skill_scan_cache: dict = {}
+
+
+def _scan_skills(base: Path) -> list:
+    """Single-pass scan of the skill directories under ``base``.
+
+    One scandir over the base plus one over each skill directory replaces
+    the per-skill exists() probing. The result is cached per base path so
+    repeated calls in the same process are free.
+    """
+    cached = _skill_scan_cache.get(base)
+    if cached is not None:
+        return cached
+
+    try:
+        with os.scandir(base) as it:
+            dirs = [e for e in it
+                    if e.is_dir(follow_symlinks=False) and not e.name.startswith('.')]
+    except OSError:
+        dirs = []
+
+    infos = []
+    for entry in sorted(dirs, key=lambda e: e.name):
+        has_skill_md = False
+        has_scripts = False
+        with os.scandir(entry.path) as sub:
+            for child in sub:
+                if child.name == "SKILL.md":
+                    has_skill_md = True
+                elif child.name == "scripts" and child.is_dir(follow_symlinks=False):
+                    has_scripts = True
+
+        description = ""
+        if has_skill_md:
+            metadata = cached_frontmatter(Path(entry.path) / "SKILL.md")
+            description = metadata.get("description", "")[:80]
+
+        infos.append(SkillInfo(entry.name, entry.path, has_skill_md,
+                               has_scripts, description))
+
+    _skill_scan_cache[base] = infos
+    return infos
 
 
 def list_active():
     """List all active skills."""
     print("\n🟢 Active Skills\n" + "="*50)
     
-    skills = sorted([
-        d for d in SKILLS_DIR.iterdir() 
-        if d.is_dir() and not d.name.startswith('.')
-    ], key=lambda x: x.name)
+    skills = _scan_skills(SKILLS_DIR)
     
     with_scripts = 0
-    for skill in skills:
-        info = get_skill_info(skill)
-        script_icon = "📜" if info["has_scripts"] else "  "
-        desc = f" - {info['description']}" if info["description"] else ""
-        print(f"  {script_icon} {skill.name}{desc}")
-        if info["has_scripts"]:
+    for info in skills:
+        script_icon = "📜" if info.has_scripts else "  "
+        desc = f" - {info.description}" if info.description else ""
+        print(f"  {script_icon} {info.name}{desc}")
+        if info.has_scripts:
             with_scripts += 1
     
     print(f"\n✅ Total: {len(skills)} skills ({with_scripts} with scripts)")
@@ -105,6 +209,15 @@ def list_disabled():
     print(f"\n📊 Total: {len(disabled)} disabled skills")
 
 
+def _move_skill(source: Path, target: Path):
+    """Move a skill directory atomically where the filesystem allows it."""
+    try:
+        os.replace(source, target)
+    except OSError:
+        # Cross-filesystem move: fall back to copy + delete
+        shutil.move(str(source), str(target))
+
+
 def enable_skill(skill_name: str):
     """Enable a disabled skill."""
     source = DISABLED_DIR / skill_name
@@ -118,7 +231,7 @@ def enable_skill(skill_name: str):
         print(f"⚠️  Skill '{skill_name}' already active")
         return False
     
-    source.rename(target)
+    _move_skill(source, target)
     print(f"✅ Enabled: {skill_name}")
     return True
 
@@ -137,7 +250,7 @@ def disable_skill(skill_name: str):
         return False
     
     DISABLED_DIR.mkdir(exist_ok=True)
-    source.rename(target)
+    _move_skill(source, target)
     print(f"✅ Disabled: {skill_name}")
     return True
 
@@ -147,23 +260,16 @@ def search_skills(query: str):
     print(f"\n🔍 Searching for '{query}'\n" + "="*50)
     
     query_lower = query.lower()
-    matches = []
-    
-    for skill_path in SKILLS_DIR.iterdir():
-        if not skill_path.is_dir() or skill_path.name.startswith('.'):
-            continue
-        
-        info = get_skill_info(skill_path)
-        
-        # Search in name and description
-        if query_lower in skill_path.name.lower() or query_lower in info["description"].lower():
-            matches.append(info)
+    matches = [
+        info for info in _scan_skills(SKILLS_DIR)
+        if query_lower in info.name.lower() or query_lower in info.description.lower()
+    ]
     
     if matches:
         for info in matches:
-            script_icon = "📜" if info["has_scripts"] else "  "
-            desc = f" - {info['description']}" if info["description"] else ""
-            print(f"  {script_icon} {info['name']}{desc}")
+            script_icon = "📜" if info.has_scripts else "  "
+            desc = f" - {info.description}" if info.description else ""
+            print(f"  {script_icon} {info.name}{desc}")
         print(f"\n✅ Found {len(matches)} matching skills")
     else:
         print("  No skills found matching your query")
@@ -171,35 +277,27 @@ def search_skills(query: str):
 
 def show_skill_info(skill_name: str):
     """Show detailed info about a skill."""
-    skill_path = SKILLS_DIR / skill_name
+    info = next((i for i in _scan_skills(SKILLS_DIR) if i.name == skill_name), None)
     
-    if not skill_path.exists():
+    if info is None:
         print(f"❌ Skill '{skill_name}' not found")
         return
     
-    info = get_skill_info(skill_path)
-    skill_md = skill_path / "SKILL.md"
-    
     print(f"\n📦 Skill: {skill_name}\n" + "="*50)
-    print(f"Path: {info['path']}")
-    print(f"Has SKILL.md: {'✅' if info['has_skill_md'] else '❌'}")
-    print(f"Has Scripts: {'✅' if info['has_scripts'] else '❌'}")
+    print(f"Path: {info.path}")
+    print(f"Has SKILL.md: {'✅' if info.has_skill_md else '❌'}")
+    print(f"Has Scripts: {'✅' if info.has_scripts else '❌'}")
     
-    if info['has_scripts']:
-        scripts_dir = skill_path / "scripts"
-        scripts = list(scripts_dir.glob("*.py"))
+    if info.has_scripts:
+        scripts = list((Path(info.path) / "scripts").glob("*.py"))
         print(f"\nScripts ({len(scripts)}):")
         for script in scripts:
             print(f"  • {script.name}")
     
-    if skill_md.exists():
-        try:
-            content = skill_md.read_text(encoding='utf-8')
-            metadata = parse_frontmatter(content)
-            if metadata.get("description"):
-                print(f"\nDescription:\n  {metadata['description']}")
-        except:
-            pass
+    if info.has_skill_md:
+        metadata = cached_frontmatter(Path(info.path) / "SKILL.md")
+        if metadata.get("description"):
+            print(f"\nDescription:\n  {metadata['description']}")
 
 
 def main():
@@ -215,14 +313,16 @@ def main():
         list_disabled()
     elif command == "enable":
         if len(sys.argv) < 3:
-            print("❌ Usage: skills_manager.py enable SKILL_NAME")
+            print("❌ Usage: skills_manager.py enable SKILL_NAME [SKILL_NAME...]")
             sys.exit(1)
-        enable_skill(sys.argv[2])
+        for skill_name in sys.argv[2:]:
+            enable_skill(skill_name)
     elif command == "disable":
         if len(sys.argv) < 3:
-            print("❌ Usage: skills_manager.py disable SKILL_NAME")
+            print("❌ Usage: skills_manager.py disable SKILL_NAME [SKILL_NAME...]")
             sys.exit(1)
-        disable_skill(sys.argv[2])
+        for skill_name in sys.argv[2:]:
+            disable_skill(skill_name)
     elif command == "search":
         if len(sys.argv) < 3:
             print("❌ Usage: skills_manager.py search QUERY")
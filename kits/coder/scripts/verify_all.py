@@ -22,13 +22,30 @@ Includes ALL checks from AGT-Kit skills:
 """
 
 import sys
+import os
+import io
 import subprocess
+import time
 import argparse
+import asyncio
+import atexit
+import contextlib
+import importlib.util
 import json
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+# Fix console encoding; per-line flushes are disabled so the buffered
+# final report goes out in one write
+try:
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace', line_buffering=False)
+except:
+    pass
+
 # ANSI colors
 class Colors:
     HEADER = '\033[95m'
@@ -44,23 +61,24 @@ class Colors:
 def print_header(text: str):
     print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*70}{Colors.ENDC}")
     print(f"{Colors.BOLD}{Colors.CYAN}{text.center(70)}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{'='*70}{Colors.ENDC}\n")
+    print(f"{Colors.BOLD}{Colors.CYAN}{'='*70}{Colors.ENDC}\n", flush=True)
 
 
+# Live progress lines flush explicitly since line buffering is off
 def print_step(text: str):
-    print(f"{Colors.BOLD}{Colors.BLUE}🔄 {text}{Colors.ENDC}")
+    print(f"{Colors.BOLD}{Colors.BLUE}🔄 {text}{Colors.ENDC}", flush=True)
 
 
 def print_success(text: str):
-    print(f"{Colors.GREEN}✅ {text}{Colors.ENDC}")
+    print(f"{Colors.GREEN}✅ {text}{Colors.ENDC}", flush=True)
 
 
 def print_warning(text: str):
-    print(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}")
+    print(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}", flush=True)
 
 
 def print_error(text: str):
-    print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
+    print(f"{Colors.RED}❌ {text}{Colors.ENDC}", flush=True)
 
 
 # Complete verification suite organized by category
@@ -163,9 +181,72 @@ VERIFICATION_SUITE = [
     },
 ]
 
+# The table is constant, so priority order is fixed once at import rather
+# than re-sorted on every run
+VERIFICATION_SUITE.sort(key=lambda s: s["priority"])
+
+
+# On-disk project-type cache: verify runs on an unchanged tree skip the
+# package.json read and parse entirely (child scripts share the file too)
+_PROJTYPE_CACHE_FILE = Path.home() / ".cache" / "agent-kits" / "projtype.json"
+_projtype_cache: Dict[str, Any] = {}
+_projtype_loaded = False
+_projtype_dirty = False
+
+_PROJECT_MANIFESTS = ("package.json", "pubspec.yaml", "pyproject.toml")
+
+
+def _project_fingerprint(project_path: Path) -> str:
+    """Stat-level fingerprint of the manifests detection depends on."""
+    parts = []
+    for name in _PROJECT_MANIFESTS:
+        try:
+            st = os.stat(project_path / name)
+            parts.append(f"{name}:{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append(f"{name}:-")
+    return "|".join(parts)
+
 
 def detect_project_type(project_path: Path) -> Dict[str, Any]:
-    """Detect project type and relevant categories."""
+    """Detect project type and relevant categories (cached by manifest stats)."""
+    return _detect_cached(str(project_path), _project_fingerprint(project_path))
+
+
+@lru_cache(maxsize=128)
+def _detect_cached(path_str: str, fingerprint: str) -> Dict[str, Any]:
+    global _projtype_loaded, _projtype_dirty
+
+    if not _projtype_loaded:
+        _projtype_loaded = True
+        try:
+            _projtype_cache.update(json.loads(_PROJTYPE_CACHE_FILE.read_text()))
+        except (OSError, ValueError):
+            pass
+
+    entry = _projtype_cache.get(path_str)
+    if entry is not None and entry.get("fingerprint") == fingerprint:
+        return entry["info"]
+
+    info = _detect_project_type(Path(path_str))
+    _projtype_cache[path_str] = {"fingerprint": fingerprint, "info": info}
+    _projtype_dirty = True
+    return info
+
+
+def _flush_projtype_cache():
+    if _projtype_dirty:
+        try:
+            _PROJTYPE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _PROJTYPE_CACHE_FILE.write_text(json.dumps(_projtype_cache))
+        except OSError:
+            pass
+
+
+atexit.register(_flush_projtype_cache)
+
+
+def _detect_project_type(project_path: Path) -> Dict[str, Any]:
     info = {"type": "unknown", "categories": ["Security", "Code Quality", "Testing"]}
     
     if (project_path / "package.json").exists():
@@ -195,8 +276,68 @@ def detect_project_type(project_path: Path) -> Dict[str, Any]:
     return info
 
 
-def run_script(check: Dict[str, Any], project_path: Path, url: Optional[str] = None) -> Dict[str, Any]:
-    """Run validation script."""
+# Persistent worker pool for in-tree Python checks: each worker pays
+# interpreter startup once and then runs checks by importing them, so ten
+# checks cost a handful of startups instead of ten.
+_check_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_check_pool() -> ProcessPoolExecutor:
+    global _check_pool
+    if _check_pool is None:
+        _check_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 4)
+    return _check_pool
+
+
+def _run_python_check(script_path: str, argv: List[str]) -> tuple:
+    """Import a check script and run its main() inside a pooled worker.
+
+    sys.argv is patched to mimic the CLI, stdout/stderr are captured, and
+    the SystemExit every script raises carries the exit code. Runs in a
+    worker process, so redirection never races with other checks.
+    """
+    buf_out, buf_err = io.StringIO(), io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = [script_path] + argv
+    # Register under the script stem and expose its directory so process
+    # pools inside the check can pickle the module's functions
+    name = Path(script_path).stem
+    script_dir = str(Path(script_path).parent)
+    sys.path.insert(0, script_dir)
+    code = 0
+    try:
+        with contextlib.redirect_stdout(buf_out), contextlib.redirect_stderr(buf_err):
+            spec = importlib.util.spec_from_file_location(name, script_path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+            spec.loader.exec_module(module)
+            if hasattr(module, "main"):
+                module.main()
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception:
+        traceback.print_exc(file=buf_err)
+        code = 1
+    finally:
+        sys.argv = saved_argv
+        sys.modules.pop(name, None)
+        try:
+            sys.path.remove(script_dir)
+        except ValueError:
+            pass
+    return code, buf_out.getvalue(), buf_err.getvalue()
+
+
+async def run_script_async(check: Dict[str, Any], project_path: Path,
+                           url: Optional[str] = None) -> Dict[str, Any]:
+    """Run a validation script on the worker pool or as a subprocess.
+
+    In-tree Python checks are imported inside pooled workers, skipping a
+    fresh interpreter startup per check; URL-driven checks (Playwright,
+    Lighthouse) keep the subprocess path since they manage external
+    processes of their own. The event loop is single-threaded, so status
+    prints from concurrent checks interleave by line but never scramble.
+    """
     script_path = project_path / check["script"]
     
     if not script_path.exists():
@@ -210,110 +351,193 @@ def run_script(check: Dict[str, Any], project_path: Path, url: Optional[str] = N
         }
     
     print_step(f"Running: {check['name']}")
-    start_time = datetime.now()
-    
-    # Build command
-    cmd = ["python", str(script_path), str(project_path)]
+    # Monotonic clock: a direct counter read, immune to wall-clock jumps
+    t0 = time.perf_counter()
+
+    # Build CLI args
+    args = [str(project_path)]
     if url and check.get("needs_url"):
-        cmd.append(url)
-    
+        args.append(url)
+
+    in_process = script_path.suffix == ".py" and not check.get("needs_url")
+
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout
-        )
-        
-        duration = (datetime.now() - start_time).total_seconds()
-        passed = result.returncode == 0
-        
+        if in_process:
+            loop = asyncio.get_running_loop()
+            try:
+                returncode, stdout, stderr = await asyncio.wait_for(
+                    loop.run_in_executor(_get_check_pool(), _run_python_check,
+                                         str(script_path), args),
+                    timeout=600)  # 10 minute timeout
+            except asyncio.TimeoutError:
+                duration = time.perf_counter() - t0
+                print_error(f"{check['name']}: TIMEOUT (>{duration:.0f}s)")
+                return {"name": check["name"], "skill": check["skill"], "passed": False, "skipped": False, "duration": duration, "error": "Timeout"}
+        else:
+            proc = await asyncio.create_subprocess_exec(
+                "python", str(script_path), *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout_b, stderr_b = await asyncio.wait_for(
+                    proc.communicate(), timeout=600)  # 10 minute timeout
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                duration = time.perf_counter() - t0
+                print_error(f"{check['name']}: TIMEOUT (>{duration:.0f}s)")
+                return {"name": check["name"], "skill": check["skill"], "passed": False, "skipped": False, "duration": duration, "error": "Timeout"}
+            returncode = proc.returncode
+            stdout = stdout_b.decode(errors="replace")
+            stderr = stderr_b.decode(errors="replace")
+
+        duration = time.perf_counter() - t0
+        passed = returncode == 0
+
         if passed:
             print_success(f"{check['name']}: PASSED ({duration:.1f}s)")
         else:
             print_error(f"{check['name']}: FAILED ({duration:.1f}s)")
-            if result.stderr:
-                print(f"  {result.stderr[:300]}")
+            if stderr:
+                print(f"  {stderr[:300]}")
         
         return {
             "name": check["name"],
             "skill": check["skill"],
             "passed": passed,
-            "output": result.stdout[:2000] if result.stdout else "",
-            "error": result.stderr[:500] if result.stderr else "",
+            "output": stdout[:2000],
+            "error": stderr[:500],
             "skipped": False,
             "duration": duration
         }
     
-    except subprocess.TimeoutExpired:
-        duration = (datetime.now() - start_time).total_seconds()
-        print_error(f"{check['name']}: TIMEOUT (>{duration:.0f}s)")
-        return {"name": check["name"], "skill": check["skill"], "passed": False, "skipped": False, "duration": duration, "error": "Timeout"}
-    
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - t0
         print_error(f"{check['name']}: ERROR - {str(e)}")
         return {"name": check["name"], "skill": check["skill"], "passed": False, "skipped": False, "duration": duration, "error": str(e)}
 
 
-def print_final_report(results: List[Dict], start_time: datetime, project_info: Dict) -> bool:
-    """Print comprehensive final report."""
-    total_duration = (datetime.now() - start_time).total_seconds()
-    
-    print_header("📊 AGT-KIT FULL VERIFICATION REPORT")
-    
+async def run_suites(suites: List[Dict[str, Any]], project_path: Path,
+                     url: Optional[str], stop_on_fail: bool) -> (List[Dict], bool):
+    """Run verification tiers: the P0 security gate first, then every
+    remaining tier concurrently.
+
+    The checks are distinct scripts over mostly disjoint files, so beyond
+    the gate they are embarrassingly parallel; a semaphore caps the number
+    of live subprocesses at the core count.
+    """
+    results = []
+    sem = asyncio.Semaphore(os.cpu_count() or 4)
+
+    async def run_check(check, category):
+        async with sem:
+            result = await run_script_async(check, project_path, url)
+        result["category"] = category
+        return check, result
+
+    def is_critical(check, result):
+        return (stop_on_fail and check["required"]
+                and not result["passed"] and not result.get("skipped"))
+
+    # P0 gate: security runs (and must pass) before anything else starts
+    for suite in (s for s in suites if s["priority"] == 0):
+        print_header(f"📋 {suite['category'].upper()}")
+        gate = await asyncio.gather(
+            *[run_check(check, suite["category"]) for check in suite["checks"]])
+        for check, result in gate:
+            results.append(result)
+            if is_critical(check, result):
+                print_error(f"CRITICAL: {check['name']} failed. Stopping.")
+                return results, True
+
+    remaining = [s for s in suites if s["priority"] != 0]
+    if remaining:
+        print_header("📋 " + " / ".join(s["category"].upper() for s in remaining))
+        tasks = [asyncio.create_task(run_check(check, suite["category"]))
+                 for suite in remaining for check in suite["checks"]]
+        for coro in asyncio.as_completed(tasks):
+            check, result = await coro
+            results.append(result)
+            if is_critical(check, result):
+                print_error(f"CRITICAL: {check['name']} failed. Stopping.")
+                for task in tasks:
+                    task.cancel()
+                return results, True
+
+    return results, False
+
+
+def print_final_report(results: List[Dict], started: float, project_info: Dict) -> bool:
+    """Print comprehensive final report.
+
+    The report is a burst of 30-100 lines, so it is accumulated and
+    written in one call instead of flushing per print on slow consoles.
+    """
+    total_duration = time.perf_counter() - started
+
+    out: List[str] = []
+    bar = f"{Colors.BOLD}{Colors.CYAN}{'='*70}{Colors.ENDC}"
+    out.append("")
+    out.append(bar)
+    out.append(f"{Colors.BOLD}{Colors.CYAN}{'📊 AGT-KIT FULL VERIFICATION REPORT'.center(70)}{Colors.ENDC}")
+    out.append(bar)
+    out.append("")
+
     # Statistics
     total = len(results)
     passed = sum(1 for r in results if r["passed"] and not r.get("skipped"))
     failed = sum(1 for r in results if not r["passed"] and not r.get("skipped"))
     skipped = sum(1 for r in results if r.get("skipped"))
-    
-    print(f"Project Type: {project_info['type']}")
-    print(f"Total Duration: {total_duration:.1f}s")
-    print(f"Total Checks: {total}")
-    print(f"{Colors.GREEN}✅ Passed: {passed}{Colors.ENDC}")
-    print(f"{Colors.RED}❌ Failed: {failed}{Colors.ENDC}")
-    print(f"{Colors.YELLOW}⏭️  Skipped: {skipped}{Colors.ENDC}")
-    print()
-    
+
+    out.append(f"Project Type: {project_info['type']}")
+    out.append(f"Total Duration: {total_duration:.1f}s")
+    out.append(f"Total Checks: {total}")
+    out.append(f"{Colors.GREEN}✅ Passed: {passed}{Colors.ENDC}")
+    out.append(f"{Colors.RED}❌ Failed: {failed}{Colors.ENDC}")
+    out.append(f"{Colors.YELLOW}⏭️  Skipped: {skipped}{Colors.ENDC}")
+    out.append("")
+
     # Category breakdown
-    print(f"{Colors.BOLD}Results by Category:{Colors.ENDC}")
+    out.append(f"{Colors.BOLD}Results by Category:{Colors.ENDC}")
     current_category = None
     for r in results:
         if r.get("category") and r["category"] != current_category:
             current_category = r["category"]
-            print(f"\n{Colors.BOLD}{Colors.CYAN}{current_category}:{Colors.ENDC}")
-        
+            out.append(f"\n{Colors.BOLD}{Colors.CYAN}{current_category}:{Colors.ENDC}")
+
         if r.get("skipped"):
             status = f"{Colors.YELLOW}⏭️ {Colors.ENDC}"
         elif r["passed"]:
             status = f"{Colors.GREEN}✅{Colors.ENDC}"
         else:
             status = f"{Colors.RED}❌{Colors.ENDC}"
-        
+
         duration_str = f"({r.get('duration', 0):.1f}s)" if not r.get("skipped") else ""
-        print(f"  {status} {r['name']} [{r['skill']}] {duration_str}")
-    
-    print()
-    
+        out.append(f"  {status} {r['name']} [{r['skill']}] {duration_str}")
+
+    out.append("")
+
     # Failed checks detail
     if failed > 0:
-        print(f"{Colors.BOLD}{Colors.RED}❌ FAILED CHECKS:{Colors.ENDC}")
+        out.append(f"{Colors.BOLD}{Colors.RED}❌ FAILED CHECKS:{Colors.ENDC}")
         for r in results:
             if not r["passed"] and not r.get("skipped"):
-                print(f"\n{Colors.RED}✗ {r['name']} ({r['skill']}){Colors.ENDC}")
+                out.append(f"\n{Colors.RED}✗ {r['name']} ({r['skill']}){Colors.ENDC}")
                 if r.get("error"):
-                    print(f"  Error: {r['error'][:200]}")
-        print()
-    
+                    out.append(f"  Error: {r['error'][:200]}")
+        out.append("")
+
     # Final verdict
     if failed > 0:
-        print_error(f"VERIFICATION FAILED - {failed} check(s) need attention")
-        print(f"\n{Colors.YELLOW}💡 Tip: Fix critical (Security, Lint) issues first{Colors.ENDC}")
-        return False
+        out.append(f"{Colors.RED}❌ VERIFICATION FAILED - {failed} check(s) need attention{Colors.ENDC}")
+        out.append(f"\n{Colors.YELLOW}💡 Tip: Fix critical (Security, Lint) issues first{Colors.ENDC}")
     else:
-        print_success("✨ ALL CHECKS PASSED - Ready for deployment! ✨")
-        return True
+        out.append(f"{Colors.GREEN}✅ ✨ ALL CHECKS PASSED - Ready for deployment! ✨{Colors.ENDC}")
+
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
+    return failed == 0
 
 
 def main():
@@ -348,41 +572,37 @@ Examples:
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Relevant Categories: {', '.join(project_info['categories'])}")
     
-    start_time = datetime.now()
-    results = []
+    started = time.perf_counter()
     
-    # Run all verification categories
-    for suite in sorted(VERIFICATION_SUITE, key=lambda x: x["priority"]):
+    # Select relevant verification categories (table is presorted)
+    suites = []
+    for suite in VERIFICATION_SUITE:
         category = suite["category"]
-        requires_url = suite.get("requires_url", False)
         
         # Skip if category not relevant to project type
         if category not in project_info["categories"]:
             continue
         
         # Skip if requires URL and not provided
-        if requires_url and not args.url:
+        if suite.get("requires_url", False) and not args.url:
             continue
         
         # Skip E2E if flag set
         if args.no_e2e and category == "E2E Testing":
             continue
         
-        print_header(f"📋 {category.upper()}")
-        
-        for check in suite["checks"]:
-            result = run_script(check, project_path, args.url)
-            result["category"] = category
-            results.append(result)
-            
-            # Stop on critical failure if flag set
-            if args.stop_on_fail and check["required"] and not result["passed"] and not result.get("skipped"):
-                print_error(f"CRITICAL: {check['name']} failed. Stopping.")
-                print_final_report(results, start_time, project_info)
-                sys.exit(1)
+        suites.append(suite)
+    
+    results, stopped = asyncio.run(
+        run_suites(suites, project_path, args.url, args.stop_on_fail))
     
-    # Print final report
-    all_passed = print_final_report(results, start_time, project_info)
+    # Report in suite order regardless of completion order
+    order = {s["category"]: s["priority"] for s in VERIFICATION_SUITE}
+    results.sort(key=lambda r: order.get(r.get("category"), 99))
+    
+    all_passed = print_final_report(results, started, project_info)
+    if stopped:
+        sys.exit(1)
     
     sys.exit(0 if all_passed else 1)
 
@@ -18,70 +18,295 @@ Checks based on WCAG 2.2:
 """
 
 import sys
+import os
 import re
 import json
+import atexit
+import hashlib
+import mmap
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
 
-# Fix console encoding
+# Fix console encoding; per-line flushes are disabled so buffered result
+# blocks go out in one write
 try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace', line_buffering=False)
 except:
     pass
 
+# orjson serializes the final report in C when installed; stdlib keeps
+# the script dependency-free. Pretty-printing is skipped when stdout is
+# piped so machine consumers get compact bytes.
+try:
+    import orjson
+
+    def _dump_json(obj) -> bytes:
+        if sys.stdout.isatty():
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return orjson.dumps(obj)
+except ImportError:
+    def _dump_json(obj) -> bytes:
+        if sys.stdout.isatty():
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _write_report(payload: bytes):
+    """Binary write to the real console; text when stdout is captured."""
+    sys.stdout.flush()
+    buf = getattr(sys.stdout, "buffer", None)
+    if buf is not None:
+        buf.write(payload)
+    else:
+        sys.stdout.write(payload.decode('utf-8'))
+
+
 SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.next', 'venv'}
 
+# One fused alternation collects every tag of interest in a single pass
+# over the file instead of ~8 separate findall scans; named groups bucket
+# the matches. Button content is inspected by a bounded forward scan from
+# each match end rather than nesting the close tag in the alternation.
+# Patterns are bytes so they run directly over the mmap'd file without
+# decoding it into a str copy.
+_A11Y_RE = re.compile(
+    rb'(?P<img><img[^>]*>)'
+    rb'|(?P<input><input[^>]*>)'
+    rb'|(?P<h1><h1[^>]*>)'
+    rb'|(?P<h2><h2[^>]*>)'
+    rb'|(?P<h3><h3[^>]*>)'
+    rb'|(?P<btn><button[^>]*>)'
+    rb'|(?P<link><a[^>]*>(?P<link_text>[^<]*)</a>)',
+    re.I,
+)
+
+# Icon-only button body: a single self-closing element and whitespace
+_ICON_INNER_RE = re.compile(rb'\s*<[^>]+/>\s*')
+
+# Caseless literal probes, replacing `in content.lower()` so the whole
+# file never gets lowercased into another copy
+_LABEL_RE = re.compile(rb'label', re.I)
+_COLOR_RE = re.compile(rb'color:', re.I)
+_CONTRAST_RE = re.compile(rb'contrast', re.I)
+_SKIP_RE = re.compile(rb'skip', re.I)
+_MAIN_RE = re.compile(rb'main', re.I)
+
+_BAD_LINK_TEXT = frozenset({b'click here', b'read more', b'here', b'more'})
+
+
+MAX_FILE_BYTES = 512_000
+_SKIP_SUFFIXES = ('.min.js', '.min.css', '.bundle.js', '.map')
+
+
+def _looks_scannable(file_path: Path) -> bool:
+    """Reject oversized, binary, or minified files before reading them whole.
+
+    Generated bundles and source maps dominate runtime without yielding
+    useful signals; a 1KB sniff catches NULs and the long-line minified
+    shape cheaply.
+    """
+    try:
+        if file_path.stat().st_size >= MAX_FILE_BYTES:
+            return False
+        with open(file_path, 'rb') as f:
+            head = f.read(1024)
+    except OSError:
+        return False
+    if b'\x00' in head:
+        return False
+    # Minified heuristic: a full first KB with almost no line breaks
+    if len(head) == 1024 and head.count(b'\n') < 2:
+        return False
+    return True
+
+
+_UI_EXTS = ('.tsx', '.jsx', '.html', '.vue')
+
+
+def _walk_files(root: Path, exts: tuple):
+    """Walk the tree once with os.scandir, pruning SKIP_DIRS.
+
+    Skipped subtrees (node_modules and friends) are never entered, unlike
+    recursive glob which visits every inode before filtering.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(exts):
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
 
 def find_ui_files(project_path: Path) -> List[Path]:
     """Find UI component files."""
-    patterns = ['**/*.tsx', '**/*.jsx', '**/*.html', '**/*.vue']
-    
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in SKIP_DIRS):
-                # Skip test files
-                if not any(x in f.name.lower() for x in ['test', 'spec', 'mock']):
-                    files.append(f)
+    for f in _walk_files(project_path, _UI_EXTS):
+        # Skip test files and generated artifacts
+        if any(x in f.name.lower() for x in ['test', 'spec', 'mock']):
+            continue
+        if f.name.endswith(_SKIP_SUFFIXES):
+            continue
+        if _looks_scannable(f):
+            files.append(f)
+            if len(files) >= 30:  # Limit
+                break
     
-    return files[:30]  # Limit
+    return files
+
+
+# Cross-run result cache: a repeated run on an unchanged tree answers from
+# stats alone. Keys hash the script name and file stats, entries live as
+# JSON lines, and insertion order doubles as the LRU order for eviction.
+SCRIPT_NAME = "a11y_checker"
+_CACHE_VERSION = 1
+_CACHE_FILE = Path.home() / ".cache" / "agent-kits" / "checks.ndjson"
+_CACHE_LIMIT = 10_000
+_cache: dict = {}
+_cache_loaded = False
+_cache_dirty = False
+
+
+def _file_key(file_path: Path):
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+    raw = f"{_CACHE_VERSION}:{SCRIPT_NAME}:{file_path}:{st.st_mtime_ns}:{st.st_size}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _load_cache():
+    global _cache_loaded
+    _cache_loaded = True
+    try:
+        with open(_CACHE_FILE, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get("v") == _CACHE_VERSION:
+                    _cache[entry["k"]] = entry["r"]
+    except OSError:
+        pass
+
+
+def _cache_lookup(key):
+    global _cache_dirty
+    if not _cache_loaded:
+        _load_cache()
+    hit = _cache.get(key)
+    if hit is not None:
+        _cache[key] = _cache.pop(key)  # refresh LRU position
+    return hit
+
+
+def _cache_store(key, result):
+    global _cache_dirty
+    _cache[key] = result
+    _cache_dirty = True
+
+
+def _flush_cache():
+    if not _cache_dirty:
+        return
+    try:
+        _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        entries = list(_cache.items())[-_CACHE_LIMIT:]
+        with open(_CACHE_FILE, 'w', encoding='utf-8') as f:
+            for key, result in entries:
+                f.write(json.dumps({"v": _CACHE_VERSION, "k": key, "r": result}) + "\n")
+    except OSError:
+        pass
+
+
+atexit.register(_flush_cache)
 
 
 def check_file(file_path: Path) -> Dict[str, Any]:
-    """Check a single file for accessibility issues."""
+    """Check a single file for accessibility issues.
+
+    The file is mmap'd and scanned as bytes in place: no utf-8 decode, no
+    full str copy, and no lowercased second copy. Only the small per-tag
+    matches are materialized.
+    """
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        f = open(file_path, 'rb')
     except:
         return {'file': file_path.name, 'passed': [], 'issues': ['Read error']}
-    
+    with f:
+        try:
+            content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):  # empty file or mmap-hostile fs
+            content = f.read()
+        try:
+            # Fast-fail: no tag open in the first 2KB means the fused tag
+            # pass cannot match anything; skip the full scan
+            if content.find(b'<', 0, 2048) == -1:
+                return {'file': file_path.name, 'passed': [], 'issues': []}
+            return _check_content(file_path, content)
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
+
+
+def _check_content(file_path: Path, content) -> Dict[str, Any]:
     passed = []
     issues = []
-    
+
+    # Single pass: bucket every matched tag by its group
+    img_tags = []
+    inputs = []
+    links = []
+    h1_count = h2_count = h3_count = 0
+    icon_buttons = 0
+    for m in _A11Y_RE.finditer(content):
+        if m.group('img') is not None:
+            img_tags.append(m.group('img'))
+        elif m.group('input') is not None:
+            inputs.append(m.group('input'))
+        elif m.group('h1') is not None:
+            h1_count += 1
+        elif m.group('h2') is not None:
+            h2_count += 1
+        elif m.group('h3') is not None:
+            h3_count += 1
+        elif m.group('btn') is not None:
+            # Inner text via the next close tag from the match end; the
+            # window is bounded so a missing close tag stays cheap
+            end = m.end()
+            close = content.find(b'</button>', end, end + 200)
+            if close != -1 and _ICON_INNER_RE.fullmatch(content, end, close):
+                icon_buttons += 1
+        elif m.group('link') is not None:
+            links.append(m.group('link_text'))
+
     # 1. Images with alt text
-    img_tags = re.findall(r'<img[^>]*>', content, re.I)
-    img_without_alt = [img for img in img_tags if 'alt=' not in img.lower()]
-    
+    img_without_alt = [img for img in img_tags if b'alt=' not in img.lower()]
+
     if img_tags and not img_without_alt:
         passed.append(f"All {len(img_tags)} images have alt text")
     elif img_without_alt:
         issues.append(f"{len(img_without_alt)} images missing alt text")
-    
+
     # 2. Form labels
-    inputs = re.findall(r'<input[^>]*>', content, re.I)
-    inputs_need_label = [i for i in inputs if 'type="hidden"' not in i.lower() and 'type="submit"' not in i.lower()]
-    
-    has_labels = 'label' in content.lower() or 'aria-label' in content.lower()
+    inputs_need_label = [i for i in inputs if b'type="hidden"' not in i.lower() and b'type="submit"' not in i.lower()]
+
+    has_labels = _LABEL_RE.search(content) is not None
     if inputs_need_label and has_labels:
         passed.append("Form labels/aria-labels found")
     elif inputs_need_label and not has_labels:
         issues.append("Form inputs may be missing labels")
     
     # 3. Heading hierarchy
-    h1_count = len(re.findall(r'<h1[^>]*>', content, re.I))
-    h2_count = len(re.findall(r'<h2[^>]*>', content, re.I))
-    h3_count = len(re.findall(r'<h3[^>]*>', content, re.I))
-    
     if h1_count <= 1:
         passed.append("Proper H1 usage (0-1)")
     else:
@@ -92,51 +317,43 @@ def check_file(file_path: Path) -> Dict[str, Any]:
         issues.append("Skipped heading level (H1 -> H3)")
     
     # 4. ARIA attributes
-    aria_patterns = ['aria-label', 'aria-labelledby', 'aria-describedby', 'role=']
-    has_aria = any(p in content for p in aria_patterns)
-    if has_aria:
+    aria_patterns = (b'aria-label', b'aria-labelledby', b'aria-describedby', b'role=')
+    if any(content.find(p) != -1 for p in aria_patterns):
         passed.append("ARIA attributes used")
-    
+
     # 5. Focus indicators
-    focus_patterns = [':focus', 'onFocus', 'tabIndex', 'focus-visible']
-    has_focus = any(p in content for p in focus_patterns)
-    if has_focus:
+    focus_patterns = (b':focus', b'onFocus', b'tabIndex', b'focus-visible')
+    if any(content.find(p) != -1 for p in focus_patterns):
         passed.append("Focus handling present")
     
-    # 6. Buttons with text/aria-label
-    buttons = re.findall(r'<button[^>]*>([^<]*)</button>', content, re.I)
-    empty_buttons = [b for b in re.findall(r'<button[^>]*>', content, re.I) 
-                     if 'aria-label' not in b.lower() and '>' in b and '</' in content[content.find(b):content.find(b)+100]]
-    
-    # Check for icon-only buttons
-    icon_buttons = re.findall(r'<button[^>]*>\s*<[^>]+/>\s*</button>', content, re.I)
+    # 6. Icon-only buttons need aria-label
     if icon_buttons:
-        issues.append(f"{len(icon_buttons)} icon-only buttons may need aria-label")
+        issues.append(f"{icon_buttons} icon-only buttons may need aria-label")
     
     # 7. Links with meaningful text
-    links = re.findall(r'<a[^>]*>([^<]*)</a>', content, re.I)
-    bad_link_text = ['click here', 'read more', 'here', 'more']
-    problematic_links = [l for l in links if l.lower().strip() in bad_link_text]
-    
+    problematic_links = [l for l in links if l.lower().strip() in _BAD_LINK_TEXT]
+
     if problematic_links:
         issues.append(f"{len(problematic_links)} links with non-descriptive text")
     elif links:
         passed.append("Link text appears descriptive")
     
     # 8. Color contrast (basic check)
-    if 'color:' in content.lower() or 'backgroundColor' in content:
-        if 'contrast' in content.lower() or '--' in content:  # CSS variables
+    if _COLOR_RE.search(content) or content.find(b'backgroundColor') != -1:
+        if _CONTRAST_RE.search(content) or content.find(b'--') != -1:  # CSS variables
             passed.append("Color theming detected")
-    
+
     # 9. Skip links
-    if 'skip' in content.lower() and 'main' in content.lower():
+    if _SKIP_RE.search(content) and _MAIN_RE.search(content):
         passed.append("Skip link pattern detected")
     
     return {'file': file_path.name, 'passed': passed, 'issues': issues}
 
 
 def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    use_cache = "--no-cache" not in sys.argv
+    project_path = Path(args[0] if args else ".").resolve()
     
     print(f"\n{'='*60}")
     print(f"[AGT-KIT A11Y CHECKER] Accessibility Audit (WCAG 2.2)")
@@ -156,42 +373,68 @@ def main():
             "files_checked": 0,
             "passed": True
         }
-        print(json.dumps(output, indent=2))
+        _write_report(_dump_json(output) + b"\n")
         sys.exit(0)
     
-    print(f"Found {len(files)} UI files to analyze\n")
+    print(f"Found {len(files)} UI files to analyze\n", flush=True)
     
     results = []
     total_passed = 0
     total_issues = 0
     
-    for file_path in files:
-        result = check_file(file_path)
-        
+    # Answer unchanged files from the cross-run cache; only misses go to
+    # the process pool. Per-file checks are pure regex CPU work with no
+    # shared state, so the pool sidesteps the GIL; ex.map preserves file
+    # order and the chunksize amortizes pickling over several files
+    file_results = [None] * len(files)
+    misses = []
+    for i, file_path in enumerate(files):
+        key = _file_key(file_path) if use_cache else None
+        hit = _cache_lookup(key) if key else None
+        if hit is not None:
+            file_results[i] = hit
+        else:
+            misses.append((i, file_path, key))
+    
+    if misses:
+        workers = max(1, (os.cpu_count() or 2) - 1)
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            fresh = list(ex.map(check_file, [f for _, f, _ in misses], chunksize=4))
+        for (i, _, key), result in zip(misses, fresh):
+            file_results[i] = result
+            if key:
+                _cache_store(key, result)
+    
+    # Result lines accumulate and flush once; per-line prints stall on
+    # slow consoles and redirected CI logs
+    out = []
+    for result in file_results:
         if result['issues'] or result['passed']:
             results.append(result)
             total_passed += len(result['passed'])
             total_issues += len(result['issues'])
-            
+
             if result['issues']:
-                print(f"⚠️  {result['file']}")
+                out.append(f"⚠️  {result['file']}")
                 for issue in result['issues'][:2]:
-                    print(f"   - {issue}")
-    
+                    out.append(f"   - {issue}")
+
     # Summary
-    print("\n" + "="*60)
-    print("SUMMARY")
-    print("="*60)
-    
-    print(f"✅ {total_passed} accessibility patterns found")
-    print(f"⚠️  {total_issues} potential issues")
-    
+    out.append("\n" + "="*60)
+    out.append("SUMMARY")
+    out.append("="*60)
+
+    out.append(f"✅ {total_passed} accessibility patterns found")
+    out.append(f"⚠️  {total_issues} potential issues")
+
     passed = total_issues < 10
-    
+
     if passed:
-        print("\n✅ Accessibility check passed")
+        out.append("\n✅ Accessibility check passed")
     else:
-        print("\n⚠️  Review accessibility issues")
+        out.append("\n⚠️  Review accessibility issues")
+
+    sys.stdout.write("\n".join(out) + "\n")
     
     output = {
         "script": "a11y_checker",
@@ -203,7 +446,7 @@ def main():
         "passed": passed
     }
     
-    print("\n" + json.dumps(output, indent=2))
+    _write_report(b"\n" + _dump_json(output) + b"\n")
     sys.exit(0 if passed else 1)
 
 
@@ -18,38 +18,288 @@ Checks:
 """
 
 import sys
+import os
 import json
 import re
+import atexit
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any
 
-# Fix console encoding
+# orjson parses large OpenAPI documents several times faster than stdlib
+# json and accepts bytes directly; fall back silently when not installed.
+# The final report serializes the same way, and pretty-printing is skipped
+# when stdout is piped so machine consumers get compact bytes.
 try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _dump_json(obj) -> bytes:
+        if sys.stdout.isatty():
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return orjson.dumps(obj)
+except ImportError:
+    _json_loads = json.loads
+
+    def _dump_json(obj) -> bytes:
+        if sys.stdout.isatty():
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _write_report(payload: bytes):
+    """Binary write to the real console; text when stdout is captured."""
+    sys.stdout.flush()
+    buf = getattr(sys.stdout, "buffer", None)
+    if buf is not None:
+        buf.write(payload)
+    else:
+        sys.stdout.write(payload.decode('utf-8'))
+
+# Fix console encoding; per-line flushes are disabled so buffered result
+# blocks go out in one write
+try:
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace', line_buffering=False)
 except:
     pass
 
 SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.next', 'venv'}
 
+# Precompiled once, with each pattern group collapsed into a single
+# alternation so a file is scanned at most once per group. check_api_code
+# pairs each with a cheap literal probe that skips the regex entirely when
+# the file cannot match.
+_ERR_RE = re.compile(r'try\s*[{:]|\.catch\(|except\s+|catch\s*\(')
+_STATUS_RE = re.compile(
+    r'\.status\(\d{3}\)|status\s*=\s*\d{3}|statusCode.*\d{3}'
+    r'|HttpStatus\.|res\.status\(')
+_VALIDATION_RE = re.compile(r'validate|schema|zod|joi|yup|pydantic|@Body\(', re.I)
+_AUTH_RE = re.compile(r'auth|jwt|bearer|token|middleware|guard', re.I)
+_RATE_RE = re.compile(r'rateLimit|throttle|rate.?limit', re.I)
+_LOG_RE = re.compile(r'console\.(log|error|warn)|logger\.|logging\.\w+')
+
+# Tokens any file defining endpoints must contain; their absence lets
+# check_api_code skip the pattern groups entirely
+_API_LITERALS = ('route', 'app.', 'router.', '@app', '@router')
+
+# When the hyperscan bindings are installed, all six pattern groups are
+# compiled into one multi-pattern database and each file gets a single
+# linear scan instead of one backtracking search per group. Match ids
+# index _CODE_GROUPS; compile failures fall back to the re path silently.
+_CODE_GROUPS = ('error', 'status', 'validation', 'auth', 'rate', 'log')
+try:
+    import hyperscan
+
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(
+        expressions=[
+            rb'try\s*[{:]|\.catch\(|except\s+|catch\s*\(',
+            rb'\.status\(\d{3}\)|status\s*=\s*\d{3}|statusCode.*\d{3}'
+            rb'|HttpStatus\.|res\.status\(',
+            rb'validate|schema|zod|joi|yup|pydantic|@Body\(',
+            rb'auth|jwt|bearer|token|middleware|guard',
+            rb'rateLimit|throttle|rate.?limit',
+            rb'console\.(log|error|warn)|logger\.|logging\.\w+',
+        ],
+        ids=list(range(len(_CODE_GROUPS))),
+        flags=[0, 0, hyperscan.HS_FLAG_CASELESS, hyperscan.HS_FLAG_CASELESS,
+               hyperscan.HS_FLAG_CASELESS, 0],
+    )
+except Exception:
+    _HS_DB = None
+
+
+def _scan_code_groups(content: str, lower: str) -> set:
+    """Return the names of pattern groups that match the file.
+
+    One hyperscan pass covers every group at once; without hyperscan each
+    group keeps its literal probe so files that cannot match skip the
+    regex entirely.
+    """
+    if _HS_DB is not None:
+        found = set()
+        _HS_DB.scan(content.encode('utf-8', 'replace'),
+                    match_event_handler=lambda pid, *_: found.add(pid))
+        return {_CODE_GROUPS[i] for i in found}
+
+    groups = set()
+    if (('try' in content or 'catch' in content or 'except' in content)
+            and _ERR_RE.search(content)):
+        groups.add('error')
+    if 'status' in lower and _STATUS_RE.search(content):
+        groups.add('status')
+    validation_literals = ('valid', 'schema', 'zod', 'joi', 'yup', 'pydantic', '@body')
+    if (any(lit in lower for lit in validation_literals)
+            and _VALIDATION_RE.search(content)):
+        groups.add('validation')
+    auth_literals = ('auth', 'jwt', 'bearer', 'token', 'middleware', 'guard')
+    if any(lit in lower for lit in auth_literals) and _AUTH_RE.search(content):
+        groups.add('auth')
+    if ('rate' in lower or 'throttle' in lower) and _RATE_RE.search(content):
+        groups.add('rate')
+    log_literals = ('console.', 'logger.', 'logging.')
+    if any(lit in content for lit in log_literals) and _LOG_RE.search(content):
+        groups.add('log')
+    return groups
+
+# Specs at or above this size answer coarse questions via token scans
+# instead of a full parse
+_SPEC_PARSE_LIMIT = 256_000
+_SPEC_METHOD_RE = re.compile(rb'"(get|post|put|patch|delete)"\s*:\s*{')
+_SPEC_METHOD_RESPONSES_RE = re.compile(
+    rb'"(get|post|put|patch|delete)"\s*:\s*{[^{}]*"responses"')
+
+
+MAX_FILE_BYTES = 512_000
+_SKIP_SUFFIXES = ('.min.js', '.min.css', '.bundle.js', '.map')
+
+
+def _looks_scannable(file_path: Path) -> bool:
+    """Reject oversized, binary, or minified files before reading them whole.
+
+    Generated bundles and source maps dominate runtime without yielding
+    useful signals; a 1KB sniff catches NULs and the long-line minified
+    shape cheaply.
+    """
+    try:
+        if file_path.stat().st_size >= MAX_FILE_BYTES:
+            return False
+        with open(file_path, 'rb') as f:
+            head = f.read(1024)
+    except OSError:
+        return False
+    if b'\x00' in head:
+        return False
+    # Minified heuristic: a full first KB with almost no line breaks
+    if len(head) == 1024 and head.count(b'\n') < 2:
+        return False
+    return True
+
+
+# Extensions collected inside each marker directory
+_MARKER_EXTS = {
+    'routes': ('.ts', '.js'),
+    'api': ('.ts', '.py'),
+    'controllers': ('.ts', '.js'),
+}
+
 
 def find_api_files(project_path: Path) -> List[tuple]:
-    """Find API-related files."""
+    """Find API-related files.
+
+    One os.scandir walk replaces ten recursive globs: SKIP_DIRS subtrees
+    are pruned before entry, specs are classified by filename, and code
+    files by the nearest routes/api/controllers ancestor.
+    """
     files = []
-    
-    patterns = {
-        'openapi': ['**/openapi*.json', '**/openapi*.yaml', '**/swagger*.json', '**/swagger*.yaml'],
-        'routes': ['**/routes/**/*.ts', '**/routes/**/*.js', '**/api/**/*.ts', '**/api/**/*.py'],
-        'controllers': ['**/controllers/**/*.ts', '**/controllers/**/*.js'],
-    }
-    
-    for file_type, globs in patterns.items():
-        for pattern in globs:
-            for f in project_path.glob(pattern):
-                if not any(skip in f.parts for skip in SKIP_DIRS):
+    stack = [(str(project_path), None)]
+    while stack and len(files) < 20:  # Limit
+        current, marker = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in SKIP_DIRS:
+                        continue
+                    stack.append((entry.path,
+                                  entry.name if entry.name in _MARKER_EXTS else marker))
+                    continue
+                
+                name = entry.name
+                lower = name.lower()
+                if name.endswith(_SKIP_SUFFIXES):
+                    continue
+                
+                if (lower.startswith(('openapi', 'swagger'))
+                        and lower.endswith(('.json', '.yaml'))):
+                    file_type = 'openapi'
+                elif marker is not None and name.endswith(_MARKER_EXTS[marker]):
+                    file_type = 'controllers' if marker == 'controllers' else 'routes'
+                else:
+                    continue
+                
+                f = Path(entry.path)
+                if _looks_scannable(f):
                     files.append((file_type, f))
+                    if len(files) >= 20:
+                        break
     
-    return files[:20]  # Limit
+    return files
+
+
+# Cross-run result cache: a repeated run on an unchanged tree answers from
+# stats alone. Keys hash the script name and file stats, entries live as
+# JSON lines, and insertion order doubles as the LRU order for eviction.
+SCRIPT_NAME = "api_validator"
+_CACHE_VERSION = 1
+_CACHE_FILE = Path.home() / ".cache" / "agent-kits" / "checks.ndjson"
+_CACHE_LIMIT = 10_000
+_cache: dict = {}
+_cache_loaded = False
+_cache_dirty = False
+
+
+def _file_key(file_path: Path):
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+    raw = f"{_CACHE_VERSION}:{SCRIPT_NAME}:{file_path}:{st.st_mtime_ns}:{st.st_size}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _load_cache():
+    global _cache_loaded
+    _cache_loaded = True
+    try:
+        with open(_CACHE_FILE, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get("v") == _CACHE_VERSION:
+                    _cache[entry["k"]] = entry["r"]
+    except OSError:
+        pass
+
+
+def _cache_lookup(key):
+    global _cache_dirty
+    if not _cache_loaded:
+        _load_cache()
+    hit = _cache.get(key)
+    if hit is not None:
+        _cache[key] = _cache.pop(key)  # refresh LRU position
+    return hit
+
+
+def _cache_store(key, result):
+    global _cache_dirty
+    _cache[key] = result
+    _cache_dirty = True
+
+
+def _flush_cache():
+    if not _cache_dirty:
+        return
+    try:
+        _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        entries = list(_cache.items())[-_CACHE_LIMIT:]
+        with open(_CACHE_FILE, 'w', encoding='utf-8') as f:
+            for key, result in entries:
+                f.write(json.dumps({"v": _CACHE_VERSION, "k": key, "r": result}) + "\n")
+    except OSError:
+        pass
+
+
+atexit.register(_flush_cache)
 
 
 def check_openapi_spec(file_path: Path) -> Dict[str, Any]:
@@ -58,14 +308,36 @@ def check_openapi_spec(file_path: Path) -> Dict[str, Any]:
     passed = []
     
     try:
-        content = file_path.read_text(encoding='utf-8')
+        # Bytes read: orjson consumes bytes natively, so JSON specs skip a
+        # utf-8 decode round-trip; only YAML needs the decoded text
+        raw = file_path.read_bytes()
         
         # JSON or YAML
         is_json = file_path.suffix == '.json'
         
-        if is_json:
+        if is_json and len(raw) >= _SPEC_PARSE_LIMIT:
+            # Token-level scan: megabyte specs never get materialized as a
+            # dict tree just to answer "are paths defined?"
+            if b'"openapi"' in raw or b'"swagger"' in raw:
+                passed.append("OpenAPI version defined")
+            if b'"info"' in raw:
+                if b'"title"' in raw:
+                    passed.append("API title defined")
+                if b'"version"' in raw:
+                    passed.append("API version defined")
+                if b'"description"' not in raw:
+                    issues.append("API description missing")
+            if b'"paths"' in raw:
+                methods = len(_SPEC_METHOD_RE.findall(raw))
+                with_responses = len(_SPEC_METHOD_RESPONSES_RE.findall(raw))
+                passed.append(f"{methods} operations defined")
+                if with_responses < methods:
+                    issues.append(f"{methods - with_responses} operations may lack responses")
+            else:
+                issues.append("No paths defined")
+        elif is_json:
             try:
-                spec = json.loads(content)
+                spec = _json_loads(raw)
                 
                 # Version check
                 if 'openapi' in spec or 'swagger' in spec:
@@ -96,10 +368,11 @@ def check_openapi_spec(file_path: Path) -> Dict[str, Any]:
                 else:
                     issues.append("No paths defined")
                     
-            except json.JSONDecodeError as e:
+            except ValueError as e:
                 issues.append(f"Invalid JSON: {str(e)[:30]}")
         else:
             # Basic YAML check
+            content = raw.decode('utf-8', 'replace')
             if 'openapi:' in content or 'swagger:' in content:
                 passed.append("OpenAPI version defined")
             if 'paths:' in content:
@@ -120,48 +393,47 @@ def check_api_code(file_path: Path) -> Dict[str, Any]:
     
     try:
         content = file_path.read_text(encoding='utf-8')
-        
+        lower = content.lower()  # lowercased once for every literal probe
+
+        # Non-API fast path: without any of these tokens the file defines
+        # no endpoints, so the pattern groups would only produce noise
+        if not any(lit in lower for lit in _API_LITERALS):
+            return {"passed": [], "issues": [], "type": "code"}
+
+        groups = _scan_code_groups(content, lower)
+
         # Error handling
-        error_patterns = [r'try\s*{', r'try:', r'\.catch\(', r'except\s+', r'catch\s*\(']
-        if any(re.search(p, content) for p in error_patterns):
+        if 'error' in groups:
             passed.append("Error handling present")
         else:
             issues.append("No error handling found")
-        
+
         # HTTP status codes
-        status_patterns = [
-            r'\.status\(\d{3}\)', r'status\s*=\s*\d{3}', r'statusCode.*\d{3}',
-            r'HttpStatus\.', r'res\.status\('
-        ]
-        if any(re.search(p, content) for p in status_patterns):
+        if 'status' in groups:
             passed.append("HTTP status codes used")
         else:
             issues.append("No explicit status codes")
-        
+
         # Input validation
-        validation_patterns = [r'validate', r'schema', r'zod', r'joi', r'yup', r'pydantic', r'@Body\(']
-        if any(re.search(p, content, re.I) for p in validation_patterns):
+        if 'validation' in groups:
             passed.append("Input validation present")
         else:
             issues.append("No input validation detected")
-        
+
         # Authentication
-        auth_patterns = [r'auth', r'jwt', r'bearer', r'token', r'middleware', r'guard']
-        if any(re.search(p, content, re.I) for p in auth_patterns):
+        if 'auth' in groups:
             passed.append("Authentication detected")
-        
+
         # Rate limiting
-        rate_patterns = [r'rateLimit', r'throttle', r'rate.?limit']
-        if any(re.search(p, content, re.I) for p in rate_patterns):
+        if 'rate' in groups:
             passed.append("Rate limiting present")
-        
+
         # Logging
-        log_patterns = [r'console\.(log|error|warn)', r'logger\.', r'logging\.\w+']
-        if any(re.search(p, content) for p in log_patterns):
+        if 'log' in groups:
             passed.append("Logging present")
-        
+
         # CORS
-        if 'cors' in content.lower():
+        if 'cors' in lower:
             passed.append("CORS configuration")
         
     except Exception as e:
@@ -170,8 +442,18 @@ def check_api_code(file_path: Path) -> Dict[str, Any]:
     return {"passed": passed, "issues": issues, "type": "code"}
 
 
+def check_api_file(item: tuple) -> Dict[str, Any]:
+    """Dispatch one (file_type, path) pair; module-level so it pickles."""
+    file_type, file_path = item
+    if file_type == 'openapi':
+        return check_openapi_spec(file_path)
+    return check_api_code(file_path)
+
+
 def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    use_cache = "--no-cache" not in sys.argv
+    project_path = Path(args[0] if args else ".").resolve()
     
     print(f"\n{'='*60}")
     print(f"[AGT-KIT API VALIDATOR] API Best Practices Check")
@@ -193,47 +475,71 @@ def main():
             "passed": True,
             "message": "No API files found"
         }
-        print(json.dumps(output, indent=2))
+        _write_report(_dump_json(output) + b"\n")
         sys.exit(0)
     
-    print(f"Found {len(api_files)} API files\n")
+    print(f"Found {len(api_files)} API files\n", flush=True)
     
     all_results = []
     total_passed = 0
     total_issues = 0
     
-    for file_type, file_path in api_files:
-        print(f"📄 {file_path.name} [{file_type}]")
-        
-        if file_type == 'openapi':
-            result = check_openapi_spec(file_path)
+    # Answer unchanged files from the cross-run cache; only misses go to
+    # the process pool. Per-file checks are pure regex CPU work with no
+    # shared state, so the pool sidesteps the GIL; ex.map preserves file
+    # order and the chunksize amortizes pickling over several files
+    file_results = [None] * len(api_files)
+    misses = []
+    for i, (file_type, file_path) in enumerate(api_files):
+        key = _file_key(file_path) if use_cache else None
+        hit = _cache_lookup(key) if key else None
+        if hit is not None:
+            file_results[i] = hit
         else:
-            result = check_api_code(file_path)
-        
+            misses.append((i, (file_type, file_path), key))
+    
+    if misses:
+        workers = max(1, (os.cpu_count() or 2) - 1)
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            fresh = list(ex.map(check_api_file, [item for _, item, _ in misses],
+                                chunksize=4))
+        for (i, _, key), result in zip(misses, fresh):
+            file_results[i] = result
+            if key:
+                _cache_store(key, result)
+    
+    # Result lines accumulate and flush once; per-line prints stall on
+    # slow consoles and redirected CI logs
+    out = []
+    for (file_type, file_path), result in zip(api_files, file_results):
+        out.append(f"📄 {file_path.name} [{file_type}]")
+
         for item in result["passed"]:
-            print(f"  ✅ {item}")
+            out.append(f"  ✅ {item}")
             total_passed += 1
         for item in result["issues"][:3]:
-            print(f"  ⚠️  {item}")
+            out.append(f"  ⚠️  {item}")
             total_issues += 1
-        
+
         all_results.append({
             "file": str(file_path.name),
             **result
         })
-        print()
-    
+        out.append("")
+
     # Summary
-    print("="*60)
-    print(f"SUMMARY: {total_passed} passed, {total_issues} issues")
-    print("="*60)
-    
+    out.append("="*60)
+    out.append(f"SUMMARY: {total_passed} passed, {total_issues} issues")
+    out.append("="*60)
+
     passed = total_issues < 5
-    
+
     if passed:
-        print("✅ API validation passed")
+        out.append("✅ API validation passed")
     else:
-        print("⚠️  API needs improvement")
+        out.append("⚠️  API needs improvement")
+
+    sys.stdout.write("\n".join(out) + "\n")
     
     output = {
         "script": "api_validator",
@@ -245,7 +551,7 @@ def main():
         "passed": passed
     }
     
-    print("\n" + json.dumps(output, indent=2))
+    _write_report(b"\n" + _dump_json(output) + b"\n")
     sys.exit(0 if passed else 1)
 
 
@@ -16,8 +16,13 @@ Checks:
 """
 
 import sys
+import os
 import json
+import mmap
 import re
+import atexit
+import hashlib
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any
@@ -28,28 +33,238 @@ try:
 except:
     pass
 
+# orjson serializes the report several times faster than stdlib json;
+# fall back silently when not installed. Pretty-printing is skipped when
+# stdout is piped so machine consumers get compact bytes.
+try:
+    import orjson
+
+    def _dump_json(obj) -> bytes:
+        if sys.stdout.isatty():
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return orjson.dumps(obj)
+except ImportError:
+    def _dump_json(obj) -> bytes:
+        if sys.stdout.isatty():
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _write_report(payload: bytes):
+    """Binary write to the real console; text when stdout is captured."""
+    sys.stdout.flush()
+    buf = getattr(sys.stdout, "buffer", None)
+    if buf is not None:
+        buf.write(payload)
+    else:
+        sys.stdout.write(payload.decode('utf-8'))
+
+# Compiled once at import so per-file validation skips the pattern cache
+# lookup (and any recompile when the cache churns). Bytes patterns run
+# directly over the mmap'd file without decoding it into a str copy.
+_PRISMA_FK_RE = re.compile(rb'(\w+Id)\s+\w+')
+_DRIZZLE_TABLE_RE = re.compile(
+    rb'(?:export\s+const|const)\s+(\w+)\s*=\s*(?:pgTable|mysqlTable|sqliteTable)')
+# One pass over each model body instead of four substring scans; the
+# group index tells us which required field was seen. The file-level
+# membership tests get the same treatment per schema type below.
+_MODEL_FLAGS_RE = re.compile(rb'(@id)|(createdAt|created_at)|(updatedAt|updated_at)')
+_PRISMA_TOP_RE = re.compile(rb'(datasource)|(generator)')
+_DRIZZLE_FLAGS_RE = re.compile(rb'(primaryKey)|((?i:timestamp)|createdAt)|(relations)')
+_TYPEORM_FLAGS_RE = re.compile(
+    rb'(@Entity)|(@PrimaryGeneratedColumn|@PrimaryColumn)|(@CreateDateColumn)')
+
+
+def _scan_flags(regex, content, count: int) -> List[bool]:
+    """One linear pass setting a flag per alternation group.
+
+    Replaces N separate substring scans over the same buffer; the walk
+    stops early once every group has been seen.
+    """
+    flags = [False] * count
+    remaining = count
+    for m in regex.finditer(content):
+        idx = m.lastindex - 1
+        if not flags[idx]:
+            flags[idx] = True
+            remaining -= 1
+            if not remaining:
+                break
+    return flags
+
+_WORD_BYTES = frozenset(
+    b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
+_WS_BYTES = frozenset(b' \t\r\n')
+
+
+def _iter_blocks(buf, keyword: bytes):
+    """Yield (name, body) for each ``keyword Name { ... }`` block.
+
+    A linear scan with a brace-depth counter replaces the DOTALL
+    alternation: no backtracking on unbalanced braces, and brace hops use
+    C-level find instead of per-byte Python steps. Bodies are yielded as
+    memoryview slices over the mmap'd buffer, so no per-block copy is
+    made; callers must drop (or release) a view before the mmap closes.
+    """
+    n = len(buf)
+    klen = len(keyword)
+    pos = 0
+    while True:
+        idx = buf.find(keyword, pos)
+        if idx == -1:
+            return
+        pos = idx + klen
+        if idx and buf[idx - 1] in _WORD_BYTES:
+            continue  # suffix of a longer identifier
+
+        # Whitespace, then the block name
+        i = pos
+        while i < n and buf[i] in _WS_BYTES:
+            i += 1
+        if i == pos:
+            continue
+        name_start = i
+        while i < n and buf[i] in _WORD_BYTES:
+            i += 1
+        if i == name_start:
+            continue
+        name = bytes(buf[name_start:i])
+
+        # Opening brace, then hop between braces tracking depth
+        while i < n and buf[i] in _WS_BYTES:
+            i += 1
+        if i >= n or buf[i] != 0x7B:  # '{'
+            continue
+        body_start = i + 1
+        depth = 1
+        i = body_start
+        while depth:
+            close = buf.find(b'}', i)
+            if close == -1:
+                return  # unbalanced; nothing more to yield
+            nested = buf.find(b'{', i, close)
+            if nested != -1:
+                depth += 1
+                i = nested + 1
+            else:
+                depth -= 1
+                i = close + 1
+
+        yield name, memoryview(buf)[body_start:i - 1]
+        pos = i
+
+
+@contextmanager
+def _mapped(file_path: Path):
+    """Read-only mmap of the file; plain bytes when mmap is unavailable."""
+    with open(file_path, 'rb') as fh:
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):  # empty file or mmap-hostile fs
+            yield fh.read()
+            return
+    try:
+        yield mm
+    finally:
+        mm.close()
+
+
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.next', 'venv'}
+
 
 def find_schema_files(project_path: Path) -> List[tuple]:
-    """Find database schema files."""
+    """Find database schema files.
+
+    One pruned walk replaces five recursive globs: SKIP_DIRS never get
+    entered, files are classified by name and parent directory, and the
+    walk stops as soon as the 15-file cap is reached.
+    """
     schemas = []
-    
-    # Prisma
-    for f in project_path.glob('**/prisma/schema.prisma'):
-        if 'node_modules' not in str(f):
-            schemas.append(('prisma', f))
-    
-    # Drizzle
-    for pattern in ['**/drizzle/*.ts', '**/db/schema*.ts', '**/schema/*.ts']:
-        for f in project_path.glob(pattern):
-            if 'node_modules' not in str(f) and ('schema' in f.name.lower() or 'table' in f.name.lower()):
-                schemas.append(('drizzle', f))
-    
-    # TypeORM entities
-    for f in project_path.glob('**/entities/*.ts'):
-        if 'node_modules' not in str(f):
-            schemas.append(('typeorm', f))
-    
-    return schemas[:15]  # Limit
+    for root, dirs, names in os.walk(str(project_path)):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        parent = os.path.basename(root)
+        for name in names:
+            if name == 'schema.prisma' and parent == 'prisma':
+                schemas.append(('prisma', Path(root) / name))
+            elif name.endswith('.ts'):
+                lower = name.lower()
+                if parent == 'entities':
+                    schemas.append(('typeorm', Path(root) / name))
+                elif (parent in ('drizzle', 'schema', 'db')
+                        and ('schema' in lower or 'table' in lower)):
+                    schemas.append(('drizzle', Path(root) / name))
+            if len(schemas) >= 15:  # Limit
+                return schemas
+
+    return schemas
+
+
+# Cross-run result cache: a repeated run on an unchanged tree answers from
+# stats alone. Keys hash the script name and file stats, entries live as
+# JSON lines, and insertion order doubles as the LRU order for eviction.
+SCRIPT_NAME = "schema_validator"
+_CACHE_VERSION = 1
+_CACHE_FILE = Path.home() / ".cache" / "agent-kits" / "checks.ndjson"
+_CACHE_LIMIT = 10_000
+_cache: dict = {}
+_cache_loaded = False
+_cache_dirty = False
+
+
+def _file_key(file_path: Path):
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+    raw = f"{_CACHE_VERSION}:{SCRIPT_NAME}:{file_path}:{st.st_mtime_ns}:{st.st_size}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _load_cache():
+    global _cache_loaded
+    _cache_loaded = True
+    try:
+        with open(_CACHE_FILE, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get("v") == _CACHE_VERSION:
+                    _cache[entry["k"]] = entry["r"]
+    except OSError:
+        pass
+
+
+def _cache_lookup(key):
+    if not _cache_loaded:
+        _load_cache()
+    hit = _cache.get(key)
+    if hit is not None:
+        _cache[key] = _cache.pop(key)  # refresh LRU position
+    return hit
+
+
+def _cache_store(key, result):
+    global _cache_dirty
+    _cache[key] = result
+    _cache_dirty = True
+
+
+def _flush_cache():
+    if not _cache_dirty:
+        return
+    try:
+        _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        entries = list(_cache.items())[-_CACHE_LIMIT:]
+        with open(_CACHE_FILE, 'w', encoding='utf-8') as f:
+            for key, result in entries:
+                f.write(json.dumps({"v": _CACHE_VERSION, "k": key, "r": result}) + "\n")
+    except OSError:
+        pass
+
+
+atexit.register(_flush_cache)
 
 
 def validate_prisma_schema(file_path: Path) -> Dict[str, Any]:
@@ -58,62 +273,67 @@ def validate_prisma_schema(file_path: Path) -> Dict[str, Any]:
     passed = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-        
-        # Find all models
-        models = re.findall(r'model\s+(\w+)\s*{([^}]+)}', content, re.DOTALL)
-        
-        if models:
-            passed.append(f"Found {len(models)} models")
-        else:
-            issues.append("No models found in schema")
-            return {"passed": passed, "issues": issues}
-        
-        for model_name, model_body in models:
-            # Check PascalCase naming
-            if not model_name[0].isupper():
-                issues.append(f"Model '{model_name}' should be PascalCase")
-            
-            # Check for id field
-            if '@id' not in model_body:
-                issues.append(f"Model '{model_name}' missing @id field")
-            
-            # Check for timestamps
-            has_created = 'createdAt' in model_body or 'created_at' in model_body
-            has_updated = 'updatedAt' in model_body or 'updated_at' in model_body
-            
-            if not has_created:
-                issues.append(f"Model '{model_name}' missing createdAt (recommended)")
-            if not has_updated:
-                issues.append(f"Model '{model_name}' missing updatedAt (recommended)")
-            
-            # Check for index on foreign keys
-            fk_fields = re.findall(r'(\w+Id)\s+\w+', model_body)
-            for fk in fk_fields:
-                if f'@@index([{fk}])' not in content and f'@@index(["{fk}"])' not in content:
-                    issues.append(f"Consider @@index([{fk}]) in {model_name}")
-        
-        # Check for enums
-        enums = re.findall(r'enum\s+(\w+)\s*{', content)
-        if enums:
-            passed.append(f"Found {len(enums)} enums")
-            for enum_name in enums:
-                if not enum_name[0].isupper():
-                    issues.append(f"Enum '{enum_name}' should be PascalCase")
-        
-        # Check for datasource
-        if 'datasource' in content:
-            passed.append("Datasource configured")
-        else:
-            issues.append("Missing datasource configuration")
-        
-        # Check for generator
-        if 'generator' in content:
-            passed.append("Generator configured")
-        
+        with _mapped(file_path) as content:
+            # Walk the models lazily: each body is a zero-copy view over
+            # the mmap, released before the next one is produced so the
+            # mmap can close cleanly on exit.
+            model_count = 0
+            for model_name_b, model_body in _iter_blocks(content, b'model'):
+                model_count += 1
+                try:
+                    model_name = model_name_b.decode('ascii', 'replace')
+                    # Check PascalCase naming
+                    if not model_name[0].isupper():
+                        issues.append(f"Model '{model_name}' should be PascalCase")
+
+                    # Check for id field and timestamps in a single scan
+                    has_id, has_created, has_updated = _scan_flags(
+                        _MODEL_FLAGS_RE, model_body, 3)
+
+                    if not has_id:
+                        issues.append(f"Model '{model_name}' missing @id field")
+                    if not has_created:
+                        issues.append(f"Model '{model_name}' missing createdAt (recommended)")
+                    if not has_updated:
+                        issues.append(f"Model '{model_name}' missing updatedAt (recommended)")
+
+                    # Check for index on foreign keys
+                    fk_fields = _PRISMA_FK_RE.findall(model_body)
+                    for fk in fk_fields:
+                        fk_name = fk.decode('ascii', 'replace')
+                        if (content.find(f'@@index([{fk_name}])'.encode()) == -1
+                                and content.find(f'@@index(["{fk_name}"])'.encode()) == -1):
+                            issues.append(f"Consider @@index([{fk_name}]) in {model_name}")
+                finally:
+                    model_body.release()
+
+            if model_count:
+                passed.append(f"Found {model_count} models")
+            else:
+                issues.append("No models found in schema")
+                return {"passed": passed, "issues": issues}
+
+            # Check for enums
+            enums = [name for name, _ in _iter_blocks(content, b'enum')]
+            if enums:
+                passed.append(f"Found {len(enums)} enums")
+                for enum_name_b in enums:
+                    enum_name = enum_name_b.decode('ascii', 'replace')
+                    if not enum_name[0].isupper():
+                        issues.append(f"Enum '{enum_name}' should be PascalCase")
+
+            # Check for datasource and generator in one pass
+            has_datasource, has_generator = _scan_flags(_PRISMA_TOP_RE, content, 2)
+            if has_datasource:
+                passed.append("Datasource configured")
+            else:
+                issues.append("Missing datasource configuration")
+            if has_generator:
+                passed.append("Generator configured")
+
     except Exception as e:
         issues.append(f"Parse error: {str(e)[:50]}")
-    
+
     return {"passed": passed, "issues": issues}
 
 
@@ -123,30 +343,26 @@ def validate_drizzle_schema(file_path: Path) -> Dict[str, Any]:
     passed = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-        
-        # Check for table definitions
-        tables = re.findall(r'(?:export\s+const|const)\s+(\w+)\s*=\s*(?:pgTable|mysqlTable|sqliteTable)', content)
-        
-        if tables:
-            passed.append(f"Found {len(tables)} tables")
-        else:
-            issues.append("No table definitions found")
-        
-        # Check for id columns
-        if 'primaryKey' in content or '.primaryKey()' in content:
-            passed.append("Primary keys defined")
-        else:
-            issues.append("Missing primary key definitions")
-        
-        # Check for timestamps
-        if 'timestamp' in content.lower() or 'createdAt' in content:
-            passed.append("Timestamp fields found")
-        
-        # Check for relations
-        if 'relations' in content:
-            passed.append("Relations defined")
-        
+        with _mapped(file_path) as content:
+            # Check for table definitions
+            tables = _DRIZZLE_TABLE_RE.findall(content)
+
+            if tables:
+                passed.append(f"Found {len(tables)} tables")
+            else:
+                issues.append("No table definitions found")
+
+            # Primary keys, timestamps and relations in one pass
+            has_pk, has_ts, has_rel = _scan_flags(_DRIZZLE_FLAGS_RE, content, 3)
+            if has_pk:
+                passed.append("Primary keys defined")
+            else:
+                issues.append("Missing primary key definitions")
+            if has_ts:
+                passed.append("Timestamp fields found")
+            if has_rel:
+                passed.append("Relations defined")
+
     except Exception as e:
         issues.append(f"Parse error: {str(e)[:50]}")
     
@@ -159,26 +375,22 @@ def validate_typeorm_entity(file_path: Path) -> Dict[str, Any]:
     passed = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-        
-        # Check for @Entity decorator
-        if '@Entity' in content:
-            passed.append("@Entity decorator found")
-        else:
-            issues.append("Missing @Entity decorator")
-        
-        # Check for @PrimaryGeneratedColumn or @PrimaryColumn
-        if '@PrimaryGeneratedColumn' in content or '@PrimaryColumn' in content:
-            passed.append("Primary key defined")
-        else:
-            issues.append("Missing primary key column")
-        
-        # Check for @CreateDateColumn
-        if '@CreateDateColumn' in content:
-            passed.append("CreateDateColumn found")
-        else:
-            issues.append("Consider adding @CreateDateColumn")
-        
+        with _mapped(file_path) as content:
+            # Entity, primary key and create-date decorators in one pass
+            has_entity, has_pk, has_cdc = _scan_flags(_TYPEORM_FLAGS_RE, content, 3)
+            if has_entity:
+                passed.append("@Entity decorator found")
+            else:
+                issues.append("Missing @Entity decorator")
+            if has_pk:
+                passed.append("Primary key defined")
+            else:
+                issues.append("Missing primary key column")
+            if has_cdc:
+                passed.append("CreateDateColumn found")
+            else:
+                issues.append("Consider adding @CreateDateColumn")
+
     except Exception as e:
         issues.append(f"Parse error: {str(e)[:50]}")
     
@@ -186,7 +398,9 @@ def validate_typeorm_entity(file_path: Path) -> Dict[str, Any]:
 
 
 def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    use_cache = "--no-cache" not in sys.argv
+    project_path = Path(args[0] if args else ".").resolve()
     
     print(f"\n{'='*60}")
     print(f"[AGT-KIT SCHEMA VALIDATOR] Database Schema Check")
@@ -207,53 +421,63 @@ def main():
             "passed": True,
             "message": "No schema files found"
         }
-        print(json.dumps(output, indent=2))
+        _write_report(_dump_json(output) + b"\n")
         sys.exit(0)
     
     all_results = []
     total_issues = 0
     
+    # Result lines accumulate and flush once; per-line prints stall on
+    # slow consoles and redirected CI logs
+    out = []
     for schema_type, file_path in schemas:
-        print(f"\n📄 {file_path.name} ({schema_type})")
-        
-        if schema_type == 'prisma':
-            result = validate_prisma_schema(file_path)
-        elif schema_type == 'drizzle':
-            result = validate_drizzle_schema(file_path)
-        elif schema_type == 'typeorm':
-            result = validate_typeorm_entity(file_path)
-        else:
-            result = {"passed": [], "issues": []}
-        
-        # Print results
+        out.append(f"\n📄 {file_path.name} ({schema_type})")
+
+        # Unchanged files answer from the cross-run cache with one stat
+        key = _file_key(file_path) if use_cache else None
+        result = _cache_lookup(key) if key else None
+        if result is None:
+            if schema_type == 'prisma':
+                result = validate_prisma_schema(file_path)
+            elif schema_type == 'drizzle':
+                result = validate_drizzle_schema(file_path)
+            elif schema_type == 'typeorm':
+                result = validate_typeorm_entity(file_path)
+            else:
+                result = {"passed": [], "issues": []}
+            if key:
+                _cache_store(key, result)
+
         for item in result["passed"]:
-            print(f"  ✅ {item}")
+            out.append(f"  ✅ {item}")
         for item in result["issues"][:5]:
-            print(f"  ⚠️  {item}")
-        
+            out.append(f"  ⚠️  {item}")
+
         if len(result["issues"]) > 5:
-            print(f"  ... and {len(result['issues']) - 5} more issues")
-        
+            out.append(f"  ... and {len(result['issues']) - 5} more issues")
+
         all_results.append({
             "file": str(file_path.name),
             "type": schema_type,
             **result
         })
         total_issues += len(result["issues"])
-    
+
     # Summary
-    print("\n" + "="*60)
-    print("SUMMARY")
-    print("="*60)
-    
+    out.append("\n" + "="*60)
+    out.append("SUMMARY")
+    out.append("="*60)
+
     # Schema issues are warnings, not failures
     passed = total_issues < 10
-    
+
     if passed:
-        print(f"✅ Schema validation passed ({total_issues} minor issues)")
+        out.append(f"✅ Schema validation passed ({total_issues} minor issues)")
     else:
-        print(f"⚠️  Schema needs review ({total_issues} issues)")
-    
+        out.append(f"⚠️  Schema needs review ({total_issues} issues)")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
     output = {
         "script": "schema_validator",
         "skill": "database-design",
@@ -264,7 +488,7 @@ def main():
         "results": all_results
     }
     
-    print("\n" + json.dumps(output, indent=2))
+    _write_report(b"\n" + _dump_json(output) + b"\n")
     sys.exit(0)
 
 
@@ -15,8 +15,14 @@ Checks:
 """
 
 import sys
+import os
+import mmap
 import re
 import json
+import atexit
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Set, Any
@@ -27,6 +33,37 @@ try:
 except:
     pass
 
+# orjson parses locale JSON straight from bytes in C, skipping the str
+# decode round-trip; fall back silently when not installed. The final
+# report serializes the same way, and pretty-printing is skipped when
+# stdout is piped so machine consumers get compact bytes.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _dump_json(obj) -> bytes:
+        if sys.stdout.isatty():
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return orjson.dumps(obj)
+except ImportError:
+    _json_loads = json.loads
+
+    def _dump_json(obj) -> bytes:
+        if sys.stdout.isatty():
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _write_report(payload: bytes):
+    """Binary write to the real console; text when stdout is captured."""
+    sys.stdout.flush()
+    buf = getattr(sys.stdout, "buffer", None)
+    if buf is not None:
+        buf.write(payload)
+    else:
+        sys.stdout.write(payload.decode('utf-8'))
+
 SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.next', 'venv'}
 
 # Patterns indicating hardcoded strings
@@ -56,38 +93,153 @@ I18N_PATTERNS = [
     r'FormattedMessage',   # react-intl
 ]
 
+# Each pattern group fused into one compiled alternation so every file is
+# scanned once per group instead of once per pattern. Bytes patterns run
+# directly over the mmap'd file without decoding it into a str copy.
+_I18N_RE = re.compile("|".join(f"(?:{p})" for p in I18N_PATTERNS).encode())
+_HARDCODED_RE = {
+    file_type: re.compile("|".join(f"(?:{p})" for p in patterns).encode())
+    for file_type, patterns in HARDCODED_PATTERNS.items()
+}
+
+# When the hyperscan bindings are installed, the i18n group and every
+# per-filetype hardcoded group compile into one multi-pattern database
+# and each file gets a single linear scan instead of one backtracking
+# search per group. Id 0 is the i18n group, the rest index _HS_IDS;
+# compile failures fall back to the re path silently.
+_HS_IDS = {'jsx': 1, 'vue': 2, 'python': 3}
+try:
+    import hyperscan
+
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(
+        expressions=[_I18N_RE.pattern]
+        + [_HARDCODED_RE[ft].pattern for ft in _HS_IDS],
+        ids=[0] + list(_HS_IDS.values()),
+        flags=[0] * (1 + len(_HS_IDS)),
+    )
+except Exception:
+    _HS_DB = None
+
+
+# Cross-run result cache: a repeated run on an unchanged tree answers from
+# stats alone. Keys hash the script name and file stats, entries live as
+# JSON lines, and insertion order doubles as the LRU order for eviction.
+SCRIPT_NAME = "i18n_checker"
+_CACHE_VERSION = 1
+_CACHE_FILE = Path.home() / ".cache" / "agent-kits" / "checks.ndjson"
+_CACHE_LIMIT = 10_000
+_cache: dict = {}
+_cache_loaded = False
+_cache_dirty = False
+
+
+def _file_key(file_path) -> Any:
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    raw = f"{_CACHE_VERSION}:{SCRIPT_NAME}:{file_path}:{st.st_mtime_ns}:{st.st_size}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _load_cache():
+    global _cache_loaded
+    _cache_loaded = True
+    try:
+        with open(_CACHE_FILE, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get("v") == _CACHE_VERSION:
+                    _cache[entry["k"]] = entry["r"]
+    except OSError:
+        pass
+
+
+def _cache_lookup(key):
+    if not _cache_loaded:
+        _load_cache()
+    hit = _cache.get(key)
+    if hit is not None:
+        _cache[key] = _cache.pop(key)  # refresh LRU position
+    return hit
+
+
+def _cache_store(key, result):
+    global _cache_dirty
+    _cache[key] = result
+    _cache_dirty = True
+
+
+def _flush_cache():
+    if not _cache_dirty:
+        return
+    try:
+        _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        entries = list(_cache.items())[-_CACHE_LIMIT:]
+        with open(_CACHE_FILE, 'w', encoding='utf-8') as f:
+            for key, result in entries:
+                f.write(json.dumps({"v": _CACHE_VERSION, "k": key, "r": result}) + "\n")
+    except OSError:
+        pass
+
+
+atexit.register(_flush_cache)
+
+
+# Directory names that mark a subtree as holding translations
+_LOCALE_DIRS = {'locales', 'translations', 'lang', 'i18n', 'messages'}
+
 
 def find_locale_files(project_path: Path) -> List[Path]:
-    """Find translation/locale files."""
-    patterns = [
-        '**/locales/**/*.json',
-        '**/translations/**/*.json',
-        '**/lang/**/*.json',
-        '**/i18n/**/*.json',
-        '**/messages/*.json',
-    ]
-    
+    """Find translation/locale files.
+
+    One pruned walk instead of five recursive globs: SKIP_DIRS never get
+    entered, a JSON file counts when any directory on its relative path
+    is a locale marker, and the walk stops at the 200-file cap instead
+    of scanning the rest of the tree.
+    """
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in SKIP_DIRS):
-                files.append(f)
-    
+    root_str = str(project_path)
+    for root, dirs, names in os.walk(root_str):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        rel = os.path.relpath(root, root_str)
+        if rel == '.' or _LOCALE_DIRS.isdisjoint(rel.split(os.sep)):
+            continue
+        for name in names:
+            if name.endswith('.json'):
+                files.append(Path(root) / name)
+                if len(files) >= 200:  # Limit
+                    return files
+
     return files
 
 
-def flatten_keys(d: dict, prefix: str = '') -> Set[str]:
-    """Flatten nested dict keys."""
+def flatten_keys(d: dict) -> Set[str]:
+    """Flatten nested dict keys.
+
+    Iterative stack walk into a single result set: no recursion frames,
+    no per-level set merges, and prefixes stay tuples until a leaf
+    actually needs the joined string.
+    """
     keys = set()
-    for k, v in d.items():
-        new_key = f"{prefix}.{k}" if prefix else k
-        if isinstance(v, dict):
-            keys.update(flatten_keys(v, new_key))
-        else:
-            keys.add(new_key)
+    stack = [(d, ())]
+    while stack:
+        node, prefix = stack.pop()
+        for k, v in node.items():
+            if isinstance(v, dict):
+                stack.append((v, prefix + (k,)))
+            else:
+                keys.add('.'.join(prefix + (k,)) if prefix else k)
     return keys
 
 
+_EMPTY_SET: Set[str] = frozenset()
+
+
 def check_locale_completeness(locale_files: List[Path]) -> Dict[str, Any]:
     """Check if all locales have the same keys."""
     issues = []
@@ -103,7 +255,7 @@ def check_locale_completeness(locale_files: List[Path]) -> Dict[str, Any]:
         if f.suffix == '.json':
             try:
                 lang = f.parent.name
-                content = json.loads(f.read_text(encoding='utf-8'))
+                content = _json_loads(f.read_bytes())
                 if lang not in locales:
                     locales[lang] = {}
                 locales[lang][f.stem] = flatten_keys(content)
@@ -119,20 +271,23 @@ def check_locale_completeness(locale_files: List[Path]) -> Dict[str, Any]:
     # Compare keys across locales
     all_langs = list(locales.keys())
     base_lang = all_langs[0]
-    
-    for namespace in locales.get(base_lang, {}):
-        base_keys = locales[base_lang].get(namespace, set())
-        
+    base_namespaces = locales.get(base_lang, {})
+
+    for namespace in base_namespaces:
+        base_keys = base_namespaces.get(namespace, _EMPTY_SET)
+
         for lang in all_langs[1:]:
-            other_keys = locales.get(lang, {}).get(namespace, set())
-            
-            missing = base_keys - other_keys
-            if missing:
-                issues.append(f"{lang}/{namespace}: Missing {len(missing)} keys")
-            
-            extra = other_keys - base_keys
-            if extra and len(extra) > 3:
-                issues.append(f"{lang}/{namespace}: {len(extra)} extra keys")
+            other_keys = locales.get(lang, {}).get(namespace, _EMPTY_SET)
+            if base_keys == other_keys:
+                continue
+
+            n_missing = len(base_keys.difference(other_keys))
+            if n_missing:
+                issues.append(f"{lang}/{namespace}: Missing {n_missing} keys")
+
+            n_extra = len(other_keys.difference(base_keys))
+            if n_extra > 3:
+                issues.append(f"{lang}/{namespace}: {n_extra} extra keys")
     
     if not issues:
         passed.append("All locales have matching keys")
@@ -140,56 +295,129 @@ def check_locale_completeness(locale_files: List[Path]) -> Dict[str, Any]:
     return {'passed': passed, 'issues': issues}
 
 
-def check_hardcoded_strings(project_path: Path) -> Dict[str, Any]:
+_EXTENSIONS = {
+    '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
+    '.vue': 'vue',
+    '.py': 'python'
+}
+
+# Below this file count the pool's spawn cost outweighs the scan work
+_POOL_THRESHOLD = 16
+
+# Basenames to drop from the scan, as one pass instead of three substring
+# probes per file
+_SKIP_NAME_RE = re.compile(r'test|spec|config')
+
+
+@lru_cache(maxsize=16)
+def _scanners_for(ext: str) -> tuple:
+    """Resolve an extension to its (hyperscan id, hardcoded regex) pair.
+
+    Cached so the per-file hot path does one dict probe instead of two.
+    """
+    file_type = _EXTENSIONS.get(ext, 'jsx')
+    return _HS_IDS[file_type], _HARDCODED_RE[file_type]
+
+
+def _scan_file(path_str: str) -> tuple:
+    """Scan one file; module-level so it pickles for the process pool.
+
+    Returns (has_i18n, has_hardcoded, example_or_None); the file is
+    mmap'd and scanned as bytes in place, and the fused hardcoded pass
+    only runs when no i18n usage was found.
+    """
+    try:
+        fh = open(path_str, 'rb')
+    except:
+        return (False, False, None)
+    with fh:
+        try:
+            content = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):  # empty file or mmap-hostile fs
+            content = fh.read()
+        try:
+            hs_id, hard_re = _scanners_for(os.path.splitext(path_str)[1])
+
+            if _HS_DB is not None:
+                found = set()
+                _HS_DB.scan(content,
+                            match_event_handler=lambda pid, *_: found.add(pid))
+                if 0 in found:
+                    return (True, False, None)
+                if hs_id not in found:
+                    return (False, False, None)
+                # Rerun the re pattern only to pull the example snippet
+            elif _I18N_RE.search(content):
+                return (True, False, None)
+
+            match = hard_re.search(content)
+            if match:
+                snippet = match.group(0)[:30].decode('utf-8', 'replace')
+                example = f"{os.path.basename(path_str)}: {snippet}..."
+                return (False, True, example)
+            return (False, False, None)
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
+
+
+def check_hardcoded_strings(project_path: Path, use_cache: bool = True) -> Dict[str, Any]:
     """Check for hardcoded strings in code files."""
     issues = []
     passed = []
-    
-    extensions = {
-        '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
-        '.vue': 'vue',
-        '.py': 'python'
-    }
-    
+
+    # One pruned walk instead of one rglob per extension
     code_files = []
-    for ext in extensions:
-        for f in project_path.rglob(f"*{ext}"):
-            if not any(skip in f.parts for skip in SKIP_DIRS):
-                if not any(x in f.name for x in ['test', 'spec', 'config']):
-                    code_files.append(f)
-    
+    for root, dirs, names in os.walk(str(project_path)):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in names:
+            if (os.path.splitext(name)[1] in _EXTENSIONS
+                    and not _SKIP_NAME_RE.search(name)):
+                code_files.append(Path(root) / name)
+
     if not code_files:
         return {'passed': ['No code files found'], 'issues': []}
-    
+
     files_with_i18n = 0
     files_with_hardcoded = 0
     examples = []
-    
-    for file_path in code_files[:50]:  # Limit
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            ext = file_path.suffix
-            file_type = extensions.get(ext, 'jsx')
-            
-            # Check for i18n usage
-            has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
-            if has_i18n:
-                files_with_i18n += 1
-            
-            # Check for hardcoded strings
-            patterns = HARDCODED_PATTERNS.get(file_type, [])
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, content)
-                if matches and not has_i18n:
-                    files_with_hardcoded += 1
-                    if len(examples) < 5:
-                        examples.append(f"{file_path.name}: {str(matches[0])[:30]}...")
-                    break
-                    
-        except:
-            continue
-    
+
+    # Unchanged files answer from the cross-run cache; only misses get
+    # scanned. Per-file scans are pure regex CPU work with no shared
+    # state, so a process pool sidesteps the GIL; small batches stay
+    # sequential since spawning workers would cost more than the scans
+    targets = [str(p) for p in code_files[:50]]  # Limit
+    scans = [None] * len(targets)
+    misses = []
+    for i, target in enumerate(targets):
+        key = _file_key(target) if use_cache else None
+        hit = _cache_lookup(key) if key else None
+        if hit is not None:
+            scans[i] = hit
+        else:
+            misses.append((i, target, key))
+
+    if misses:
+        paths = [t for _, t, _ in misses]
+        if len(paths) >= _POOL_THRESHOLD:
+            workers = max(1, (os.cpu_count() or 2) - 1)
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                fresh = list(ex.map(_scan_file, paths, chunksize=8))
+        else:
+            fresh = [_scan_file(t) for t in paths]
+        for (i, _, key), result in zip(misses, fresh):
+            scans[i] = result
+            if key:
+                _cache_store(key, list(result))
+
+    for has_i18n, has_hardcoded, example in scans:
+        if has_i18n:
+            files_with_i18n += 1
+        elif has_hardcoded:
+            files_with_hardcoded += 1
+            if example and len(examples) < 5:
+                examples.append(example)
+
     passed.append(f"Analyzed {len(code_files)} code files")
     
     if files_with_i18n > 0:
@@ -206,7 +434,9 @@ def check_hardcoded_strings(project_path: Path) -> Dict[str, Any]:
 
 
 def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    use_cache = "--no-cache" not in sys.argv
+    project_path = Path(args[0] if args else ".").resolve()
     
     print(f"\n{'='*60}")
     print(f"[AGT-KIT i18n CHECKER] Internationalization Audit")
@@ -220,36 +450,40 @@ def main():
     locale_result = check_locale_completeness(locale_files)
     
     # Check hardcoded strings
-    code_result = check_hardcoded_strings(project_path)
+    code_result = check_hardcoded_strings(project_path, use_cache)
     
-    # Print results
-    print("\n📁 LOCALE FILES")
-    print("-"*40)
+    # Result lines accumulate and flush once; per-line prints stall on
+    # slow consoles and redirected CI logs
+    out = []
+    out.append("\n📁 LOCALE FILES")
+    out.append("-"*40)
     for item in locale_result['passed']:
-        print(f"  ✅ {item}")
+        out.append(f"  ✅ {item}")
     for item in locale_result['issues']:
-        print(f"  ⚠️  {item}")
-    
-    print("\n💻 CODE ANALYSIS")
-    print("-"*40)
+        out.append(f"  ⚠️  {item}")
+
+    out.append("\n💻 CODE ANALYSIS")
+    out.append("-"*40)
     for item in code_result['passed']:
-        print(f"  ✅ {item}")
+        out.append(f"  ✅ {item}")
     for item in code_result['issues']:
-        print(f"  ⚠️  {item}")
-    
+        out.append(f"  ⚠️  {item}")
+
     # Summary
     all_issues = locale_result['issues'] + code_result['issues']
     critical = sum(1 for i in all_issues if 'hardcoded' in i.lower() or 'missing' in i.lower())
-    
-    print("\n" + "="*60)
-    
+
+    out.append("\n" + "="*60)
+
     passed = critical == 0
-    
+
     if passed:
-        print("✅ i18n CHECK PASSED")
+        out.append("✅ i18n CHECK PASSED")
     else:
-        print(f"⚠️  i18n CHECK: {critical} issues found")
-    
+        out.append(f"⚠️  i18n CHECK: {critical} issues found")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
     output = {
         "script": "i18n_checker",
         "skill": "i18n-localization",
@@ -259,7 +493,7 @@ def main():
         "passed": passed
     }
     
-    print("\n" + json.dumps(output, indent=2))
+    _write_report(b"\n" + _dump_json(output) + b"\n")
     sys.exit(0 if passed else 1)
 
 
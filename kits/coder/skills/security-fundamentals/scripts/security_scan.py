@@ -24,6 +24,11 @@ import os
 import sys
 import re
 import argparse
+import atexit
+import hashlib
+import mmap
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any
 from datetime import datetime
@@ -35,6 +40,37 @@ try:
 except:
     pass
 
+# orjson serializes the report and parses npm audit output several
+# times faster than stdlib json; fall back silently when not installed.
+# Pretty-printing is skipped when stdout is piped so machine consumers
+# get compact bytes.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _dump_json(obj) -> bytes:
+        if sys.stdout.isatty():
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return orjson.dumps(obj)
+except ImportError:
+    _json_loads = json.loads
+
+    def _dump_json(obj) -> bytes:
+        if sys.stdout.isatty():
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _write_report(payload: bytes):
+    """Binary write to the real console; text when stdout is captured."""
+    sys.stdout.flush()
+    buf = getattr(sys.stdout, "buffer", None)
+    if buf is not None:
+        buf.write(payload)
+    else:
+        sys.stdout.write(payload.decode('utf-8'))
+
 
 # Secret patterns to detect
 SECRET_PATTERNS = [
@@ -47,9 +83,15 @@ SECRET_PATTERNS = [
     (r'AKIA[0-9A-Z]{16}', "AWS Access Key", "critical"),
     (r'aws[_-]?secret[_-]?access[_-]?key\s*[=:]\s*["\'][^"\']+["\']', "AWS Secret", "critical"),
     
-    # Database & Connections
+    # Database & Connections. One pattern per scheme: a leading literal
+    # lets the regex engine (and hyperscan) find the scheme bytes with a
+    # fast substring scan before running the tail, which a leading
+    # alternation would defeat.
     (r'password\s*[=:]\s*["\'][^"\']{4,}["\']', "Password", "high"),
-    (r'(mongodb|postgres|mysql|redis):\/\/[^\s"\']+', "Database URI", "critical"),
+    (r'mongodb:\/\/[^\s"\']+', "Database URI", "critical"),
+    (r'postgres:\/\/[^\s"\']+', "Database URI", "critical"),
+    (r'mysql:\/\/[^\s"\']+', "Database URI", "critical"),
+    (r'redis:\/\/[^\s"\']+', "Database URI", "critical"),
     
     # Private Keys
     (r'-----BEGIN\s+(RSA|PRIVATE|EC)\s+KEY-----', "Private Key", "critical"),
@@ -58,6 +100,64 @@ SECRET_PATTERNS = [
     (r'eyJ[A-Za-z0-9-_]+\.eyJ[A-Za-z0-9-_]+\.[A-Za-z0-9-_]+', "JWT Token", "high"),
 ]
 
+# All secret patterns fused into one alternation so each file is swept
+# once instead of once per pattern. Patterns carry nested groups of
+# their own, so the outer group index for a match is recovered by
+# bisecting match.lastindex into the recorded group starts. Bytes
+# patterns run directly over the mmap'd file without decoding it into a
+# str copy.
+_SECRET_GROUP_STARTS = []
+_parts = []
+_group = 1
+for _pattern, _, _ in SECRET_PATTERNS:
+    _SECRET_GROUP_STARTS.append(_group)
+    _parts.append(f"({_pattern})")
+    _group += 1 + re.compile(_pattern).groups
+_SECRET_RE = re.compile("|".join(_parts).encode(), re.IGNORECASE)
+del _parts, _group, _pattern
+
+# Stage-1 prefilter: a plain literal alternation, one per pattern, that
+# decides whether the full fused regex runs at all. Most files contain
+# none of these fragments, so the common case is a single cheap sweep
+# with no quantifiers or classes to evaluate.
+_SECRET_PROBE_RE = re.compile(
+    rb'api|token|bearer|akia|secret|password'
+    rb'|mongodb|postgres|mysql|redis|-----begin|eyj', re.IGNORECASE)
+
+# When the hyperscan bindings are installed, the secret patterns compile
+# into one multi-pattern database scanned with SIMD kernels; match ids
+# index SECRET_PATTERNS directly and SINGLEMATCH caps each pattern at
+# one report per file. Compile failures fall back to the re path
+# silently. The dangerous-pattern scan keeps its own path below.
+try:
+    import hyperscan
+
+    _HS_SECRET_DB = hyperscan.Database()
+    _HS_SECRET_DB.compile(
+        expressions=[p.encode() for p, _, _ in SECRET_PATTERNS],
+        ids=list(range(len(SECRET_PATTERNS))),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH]
+        * len(SECRET_PATTERNS),
+    )
+except Exception:
+    _HS_SECRET_DB = None
+
+
+def _secret_hits(content) -> set:
+    """Return the indexes of secret patterns that match the content."""
+    hit_ids = set()
+    if _HS_SECRET_DB is not None:
+        _HS_SECRET_DB.scan(content,
+                           match_event_handler=lambda pid, *_: hit_ids.add(pid))
+        return hit_ids
+    if _SECRET_PROBE_RE.search(content) is None:
+        return hit_ids
+    for m in _SECRET_RE.finditer(content):
+        hit_ids.add(bisect_right(_SECRET_GROUP_STARTS, m.lastindex) - 1)
+        if len(hit_ids) == len(SECRET_PATTERNS):
+            break
+    return hit_ids
+
 # Dangerous code patterns
 DANGEROUS_PATTERNS = [
     # Injection risks
@@ -77,10 +177,68 @@ DANGEROUS_PATTERNS = [
     (r'verify\s*=\s*False', "SSL Verify Disabled", "high", "MITM"),
 ]
 
+# Compiled once at import so the files x lines x patterns loop skips the
+# per-call pattern cache lookup and flag parsing
+_DANGEROUS_COMPILED = [
+    (re.compile(pattern.encode(), re.IGNORECASE), name, severity, category)
+    for pattern, name, severity, category in DANGEROUS_PATTERNS
+]
+
+# Stage-1 prefilter for the dangerous sweep, same idea as the secret
+# probe above: if none of these fragments occur, none of the compiled
+# patterns can match and all of them are skipped
+_DANGEROUS_PROBE_RE = re.compile(
+    rb'eval|exec|function|innerhtml'
+    rb'|select|insert|update|delete|verify', re.IGNORECASE)
+
+_NEWLINE_RE = re.compile(b'\n')
+
+# At most this many findings per pattern per file; the report truncates
+# anyway and repetitive minified files would otherwise flood the list
+_MAX_HITS_PER_PATTERN = 3
+
+
+def _dangerous_hits(content) -> List[tuple]:
+    """Return (line, pattern index) pairs for dangerous-pattern matches.
+
+    Each compiled pattern sweeps the whole file once in C; line numbers
+    come from bisecting match offsets into the newline positions, which
+    are only collected when something actually matched. Pairs are unique,
+    sorted so findings keep the per-line, per-pattern order of the old
+    line loop, and capped per pattern: a repetitive file reporting the
+    same pattern hundreds of times would only be truncated later anyway.
+    """
+    if _DANGEROUS_PROBE_RE.search(content) is None:
+        return []
+    raw = []
+    for pidx, (rx, _, _, _) in enumerate(_DANGEROUS_COMPILED):
+        for m in rx.finditer(content):
+            raw.append((m.start(), pidx))
+    if not raw:
+        return []
+
+    nl_ends = [m.end() for m in _NEWLINE_RE.finditer(content)]
+    hits = sorted({(bisect_right(nl_ends, start) + 1, pidx)
+                   for start, pidx in raw})
+
+    counts = {}
+    capped = []
+    for line, pidx in hits:
+        seen = counts.get(pidx, 0)
+        if seen < _MAX_HITS_PER_PATTERN:
+            counts[pidx] = seen + 1
+            capped.append((line, pidx))
+    return capped
+
 SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv', '.next'}
 CODE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.go', '.java'}
 CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env'}
 
+# Suffix tuples feed str.endswith, one C-level check per file instead of
+# a splitext allocation plus set probes
+_CODE_SUFFIXES = tuple(CODE_EXTENSIONS)
+_CONFIG_SUFFIXES = tuple(CONFIG_EXTENSIONS)
+
 
 def scan_dependencies(project_path: str) -> Dict[str, Any]:
     """Scan for dependency vulnerabilities (OWASP A03)."""
@@ -117,7 +275,7 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
             )
             
             try:
-                audit_data = json.loads(result.stdout)
+                audit_data = _json_loads(result.stdout)
                 vulns = audit_data.get("vulnerabilities", {})
                 
                 severity_count = {"critical": 0, "high": 0, "moderate": 0}
@@ -145,100 +303,331 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_secrets(project_path: str) -> Dict[str, Any]:
-    """Scan for hardcoded secrets (OWASP A04)."""
+# Below this file count the pool's spawn cost outweighs the scan work
+_POOL_THRESHOLD = 16
+
+
+# Cross-run result cache: a repeated run on an unchanged tree answers from
+# stats alone. Keys hash the script name and file stats, entries live as
+# JSON lines, and insertion order doubles as the LRU order for eviction.
+SCRIPT_NAME = "security_scan"
+_CACHE_VERSION = 2  # v2: Database URI split changed the pattern indexes
+_CACHE_FILE = Path.home() / ".cache" / "agent-kits" / "checks.ndjson"
+_CACHE_LIMIT = 10_000
+_cache: dict = {}
+_cache_loaded = False
+_cache_dirty = False
+
+
+def _file_key(kind: str, file_path: str):
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    raw = (f"{_CACHE_VERSION}:{SCRIPT_NAME}:{kind}:{file_path}"
+           f":{st.st_mtime_ns}:{st.st_size}")
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _load_cache():
+    global _cache_loaded
+    _cache_loaded = True
+    try:
+        with open(_CACHE_FILE, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get("v") == _CACHE_VERSION:
+                    _cache[entry["k"]] = entry["r"]
+    except OSError:
+        pass
+
+
+def _cache_lookup(key):
+    if not _cache_loaded:
+        _load_cache()
+    hit = _cache.get(key)
+    if hit is not None:
+        _cache[key] = _cache.pop(key)  # refresh LRU position
+    return hit
+
+
+def _cache_store(key, result):
+    global _cache_dirty
+    _cache[key] = result
+    _cache_dirty = True
+
+
+def _flush_cache():
+    if not _cache_dirty:
+        return
+    try:
+        _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        entries = list(_cache.items())[-_CACHE_LIMIT:]
+        with open(_CACHE_FILE, 'w', encoding='utf-8') as f:
+            for key, result in entries:
+                f.write(json.dumps({"v": _CACHE_VERSION, "k": key, "r": result}) + "\n")
+    except OSError:
+        pass
+
+
+atexit.register(_flush_cache)
+
+
+def _find_scan_files(project_path: str) -> List[tuple]:
+    """One pruned walk shared by both scanners.
+
+    Returns (path, relative path, is_code) for every eligible file;
+    config files only interest the secret scanner. An iterative scandir
+    stack replaces os.walk: DirEntry type checks come from the cached
+    dirent data and paths stay plain strings throughout.
+    """
+    files = []
+    stack = [project_path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    lower = entry.name.lower()
+                    is_code = lower.endswith(_CODE_SUFFIXES)
+                    if is_code or lower.endswith(_CONFIG_SUFFIXES):
+                        files.append((entry.path,
+                                      os.path.relpath(entry.path, project_path),
+                                      is_code))
+    return files
+
+
+# Checked-in bundles and data blobs dominate scan time without yielding
+# real findings; anything bigger than this or with NULs in its head is
+# skipped before the regexes ever run
+MAX_SCAN_BYTES = 1_048_576
+
+
+def _open_scannable(path_str: str):
+    """mmap a file for scanning, or None for oversized/binary/unreadable.
+
+    The stat gate avoids touching huge blobs and a 4KB NUL sniff drops
+    binaries misclassified by extension. The bytes regexes run over the
+    map in place with no str decode; callers close mmap results when
+    done. Plain bytes come back when mmap is unavailable.
+    """
+    try:
+        fh = open(path_str, 'rb')
+    except OSError:
+        return None
+    with fh:
+        try:
+            if os.fstat(fh.fileno()).st_size > MAX_SCAN_BYTES:
+                return None
+            try:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):  # empty file or mmap-hostile fs
+                data = fh.read()
+                return None if b'\x00' in data[:4096] else data
+        except OSError:
+            return None
+    if b'\x00' in mm[:4096]:
+        mm.close()
+        return None
+    return mm
+
+
+def _scan_both_file(entry: tuple) -> tuple:
+    """Run both regex sets over one read of the file; pool worker.
+
+    Returns (relative path, secret hit indexes, pattern hits, is_code).
+    """
+    path_str, rel, is_code = entry
+    content = _open_scannable(path_str)
+    if content is None:
+        return (rel, (), [], is_code)
+    try:
+        return (rel,
+                tuple(sorted(_secret_hits(content))),
+                _dangerous_hits(content) if is_code else [],
+                is_code)
+    finally:
+        if isinstance(content, mmap.mmap):
+            content.close()
+
+
+def _scan_secrets_file(path_rel: tuple) -> tuple:
+    """Scan one file for secrets; module-level so it pickles for the pool.
+
+    Returns (relative path, sorted pattern indexes that matched).
+    """
+    path_str, rel = path_rel
+    content = _open_scannable(path_str)
+    if content is None:
+        return (rel, ())
+    try:
+        return (rel, tuple(sorted(_secret_hits(content))))
+    finally:
+        if isinstance(content, mmap.mmap):
+            content.close()
+
+
+def _scan_patterns_file(path_rel: tuple) -> tuple:
+    """Scan one file for dangerous patterns; picklable pool worker.
+
+    Returns (relative path, [(line, pattern index), ...]).
+    """
+    path_str, rel = path_rel
+    content = _open_scannable(path_str)
+    if content is None:
+        return (rel, [])
+    try:
+        return (rel, _dangerous_hits(content))
+    finally:
+        if isinstance(content, mmap.mmap):
+            content.close()
+
+
+def _map_scans(worker, files: List[tuple]) -> List[tuple]:
+    """Run a per-file worker over the file list, pooled when it pays off.
+
+    The regex sweeps are pure CPU work with no shared state, so a
+    process pool sidesteps the GIL; small batches stay sequential since
+    spawning workers would cost more than the scans.
+    """
+    if len(files) >= _POOL_THRESHOLD:
+        workers = max(1, (os.cpu_count() or 2) - 1)
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(worker, files, chunksize=8))
+    return [worker(fp) for fp in files]
+
+
+def _map_scans_cached(worker, kind: str, files: List[tuple],
+                      use_cache: bool = True) -> List[tuple]:
+    """_map_scans with the cross-run cache in front of it.
+
+    Unchanged files answer from their stat-keyed entry; only misses go
+    to the workers, and their results (everything after the relative
+    path) are stored for the next run.
+    """
+    scans = [None] * len(files)
+    misses = []
+    for i, entry in enumerate(files):
+        key = _file_key(kind, entry[0]) if use_cache else None
+        hit = _cache_lookup(key) if key else None
+        if hit is not None:
+            scans[i] = (entry[1], *hit)
+        else:
+            misses.append((i, entry, key))
+
+    if misses:
+        results = _map_scans(worker, [entry for _, entry, _ in misses])
+        for (i, entry, key), result in zip(misses, results):
+            scans[i] = result
+            if key:
+                _cache_store(key, list(result[1:]))
+    return scans
+
+
+def _assemble_secrets(scanned: int, scans: List[tuple]) -> Dict[str, Any]:
+    """Build the secret-scanner result dict from per-file hit indexes."""
     results = {
         "tool": "secret_scanner",
         "findings": [],
         "status": "✅ No secrets",
-        "scanned_files": 0,
+        "scanned_files": scanned,
         "by_severity": {"critical": 0, "high": 0, "medium": 0}
     }
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS and ext not in CONFIG_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, secret_type, severity in SECRET_PATTERNS:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "type": secret_type,
-                                "severity": severity,
-                            })
-                            results["by_severity"][severity] += 1
-            except:
-                pass
-    
+
+    for rel, hit_ids in scans:
+        for idx in hit_ids:
+            _, secret_type, severity = SECRET_PATTERNS[idx]
+            results["findings"].append({
+                "file": rel,
+                "type": secret_type,
+                "severity": severity,
+            })
+            results["by_severity"][severity] += 1
+
     if results["by_severity"]["critical"] > 0:
         results["status"] = "🔴 CRITICAL: Secrets exposed!"
     elif results["by_severity"]["high"] > 0:
         results["status"] = "🟡 HIGH: Secrets found"
-    
+
     results["findings"] = results["findings"][:15]
     return results
 
 
-def scan_patterns(project_path: str) -> Dict[str, Any]:
-    """Scan for dangerous code patterns (OWASP A05)."""
+def scan_secrets(project_path: str, use_cache: bool = True) -> Dict[str, Any]:
+    """Scan for hardcoded secrets (OWASP A04)."""
+    files = [(p, rel) for p, rel, _ in _find_scan_files(project_path)]
+    return _assemble_secrets(
+        len(files),
+        _map_scans_cached(_scan_secrets_file, "secrets", files, use_cache))
+
+
+def _assemble_patterns(scanned: int, scans: List[tuple]) -> Dict[str, Any]:
+    """Build the pattern-scanner result dict from per-file hits."""
     results = {
         "tool": "pattern_scanner",
         "findings": [],
         "status": "✅ No dangerous patterns",
-        "scanned_files": 0
+        "scanned_files": scanned
     }
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        for pattern, name, severity, category in DANGEROUS_PATTERNS:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                results["findings"].append({
-                                    "file": str(filepath.relative_to(project_path)),
-                                    "line": line_num,
-                                    "pattern": name,
-                                    "severity": severity,
-                                    "category": category,
-                                })
-            except:
-                pass
-    
+
+    for rel, hits in scans:
+        for line_num, pidx in hits:
+            _, name, severity, category = _DANGEROUS_COMPILED[pidx]
+            results["findings"].append({
+                "file": rel,
+                "line": line_num,
+                "pattern": name,
+                "severity": severity,
+                "category": category,
+            })
+
     critical = sum(1 for f in results["findings"] if f["severity"] == "critical")
     if critical > 0:
         results["status"] = f"🔴 CRITICAL: {critical} dangerous patterns"
     elif results["findings"]:
         results["status"] = "🟡 Patterns need review"
-    
+
     results["findings"] = results["findings"][:20]
     return results
 
 
-def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
+def scan_patterns(project_path: str, use_cache: bool = True) -> Dict[str, Any]:
+    """Scan for dangerous code patterns (OWASP A05)."""
+    files = [(p, rel) for p, rel, is_code in _find_scan_files(project_path)
+             if is_code]
+    return _assemble_patterns(
+        len(files),
+        _map_scans_cached(_scan_patterns_file, "patterns", files, use_cache))
+
+
+def scan_all_in_one_pass(project_path: str, use_cache: bool = True) -> tuple:
+    """Run the secret and pattern scans off one walk and one read per file.
+
+    Fusing the passes halves the directory traversal, file opens and
+    decodes when a full scan asks for both.
+    """
+    files = _find_scan_files(project_path)
+    scans = _map_scans_cached(_scan_both_file, "both", files, use_cache)
+
+    secrets = _assemble_secrets(
+        len(files), [(rel, hit_ids) for rel, hit_ids, _, _ in scans])
+    patterns = _assemble_patterns(
+        sum(1 for _, _, is_code in files if is_code),
+        [(rel, hits) for rel, _, hits, is_code in scans if is_code])
+    return secrets, patterns
+
+
+def run_full_scan(project_path: str, scan_type: str = "all",
+                  use_cache: bool = True) -> Dict[str, Any]:
     """Run complete security scan."""
     report = {
         "project": project_path,
@@ -258,10 +647,19 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
         "secrets": ("secrets", scan_secrets),
         "patterns": ("code_patterns", scan_patterns),
     }
-    
+
+    # A full scan fuses secrets+patterns into one walk and one read per file
+    fused = {}
+    if scan_type == "all":
+        fused["secrets"], fused["patterns"] = scan_all_in_one_pass(
+            project_path, use_cache)
+
     for key, (name, scanner) in scanners.items():
         if scan_type == "all" or scan_type == key:
-            result = scanner(project_path)
+            result = fused.get(key)
+            if result is None:
+                result = (scanner(project_path) if key == "deps"
+                          else scanner(project_path, use_cache))
             report["scans"][name] = result
             
             findings = len(result.get("findings", []))
@@ -292,31 +690,40 @@ def main():
     parser.add_argument("--scan-type", choices=["all", "deps", "secrets", "patterns"],
                         default="all", help="Scan type")
     parser.add_argument("--output", choices=["json", "summary"], default="summary")
-    
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore cached per-file results")
+
     args = parser.parse_args()
-    
+
     if not os.path.isdir(args.project_path):
-        print(json.dumps({"error": f"Not found: {args.project_path}"}))
+        _write_report(_dump_json({"error": f"Not found: {args.project_path}"}) + b"\n")
         sys.exit(1)
-    
-    result = run_full_scan(args.project_path, args.scan_type)
+
+    result = run_full_scan(args.project_path, args.scan_type,
+                           use_cache=not args.no_cache)
     
     if args.output == "summary":
-        print(f"\n{'='*60}")
-        print(f"[AGT-KIT SECURITY SCAN] {result['project']}")
-        print(f"{'='*60}")
-        print(f"Status: {result['summary']['overall_status']}")
-        print(f"Total Findings: {result['summary']['total_findings']}")
-        print(f"  Critical: {result['summary']['critical']}")
-        print(f"  High: {result['summary']['high']}")
-        print(f"{'='*60}\n")
-        
+        # Summary lines accumulate and go out as one bytes write, so the
+        # emoji-laden report pays the codec once instead of per print
+        out = [
+            f"\n{'='*60}",
+            f"[AGT-KIT SECURITY SCAN] {result['project']}",
+            "="*60,
+            f"Status: {result['summary']['overall_status']}",
+            f"Total Findings: {result['summary']['total_findings']}",
+            f"  Critical: {result['summary']['critical']}",
+            f"  High: {result['summary']['high']}",
+            f"{'='*60}\n",
+        ]
+
         for scan_name, scan_result in result['scans'].items():
-            print(f"\n{scan_name.upper()}: {scan_result['status']}")
+            out.append(f"\n{scan_name.upper()}: {scan_result['status']}")
             for finding in scan_result.get('findings', [])[:5]:
-                print(f"  - {finding.get('type', finding.get('pattern', 'Issue'))}: {finding.get('file', finding.get('message', ''))}")
+                out.append(f"  - {finding.get('type', finding.get('pattern', 'Issue'))}: {finding.get('file', finding.get('message', ''))}")
+
+        _write_report(("\n".join(out) + "\n").encode('utf-8', 'replace'))
     else:
-        print(json.dumps(result, indent=2))
+        _write_report(_dump_json(result) + b"\n")
     
     # Exit with error if critical issues
     sys.exit(1 if result['summary']['critical'] > 0 else 0)
@@ -17,8 +17,10 @@ Checks:
 """
 
 import sys
+import os
 import re
 import json
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
@@ -31,23 +33,54 @@ except:
 
 SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.next', 'venv', 'test', 'tests'}
 
+# The structural tag tallies fused into one alternation so each page is
+# swept once instead of once per tag; the named group tells the Counter
+# which tag was seen
+_PAGE_TAG_RE = re.compile(
+    r'(?P<h1><h1[^>]*>)|(?P<h2><h2[^>]*>)'
+    r'|(?P<list><(?:ul|ol)[^>]*>)|(?P<table><table[^>]*>)', re.I)
+
+# One compiled alternation instead of a re.search per date marker
+_DATE_RE = re.compile(r'datePublished|dateModified|datetime=|pubdate', re.I)
+
+
+_PAGE_NAME_MARKERS = ('page', 'index', 'home', 'about', 'blog', 'post', 'product')
+
 
 def find_pages(project_path: Path) -> List[Path]:
-    """Find public-facing web pages."""
-    patterns = ['**/*.html', '**/pages/**/*.tsx', '**/app/**/*.tsx', '**/app/**/*.jsx']
-    
+    """Find public-facing web pages.
+
+    One pruned walk replaces four recursive globs: SKIP_DIRS never get
+    entered, files are classified by suffix and the pages/app directory
+    components, and the walk stops at the 20-page cap.
+    """
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in SKIP_DIRS):
-                # Filter to likely page files
-                name = f.stem.lower()
-                if any(x in name for x in ['page', 'index', 'home', 'about', 'blog', 'post', 'product']):
-                    files.append(f)
-                elif 'pages' in f.parts or 'app' in f.parts:
-                    files.append(f)
-    
-    return files[:20]  # Limit
+    root_str = str(project_path)
+    for root, dirs, names in os.walk(root_str):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        parts = os.path.relpath(root, root_str).split(os.sep)
+        in_pages = 'pages' in parts
+        in_app = 'app' in parts
+        for name in names:
+            if name.endswith('.html'):
+                eligible = True
+            elif name.endswith('.tsx'):
+                eligible = in_pages or in_app
+            elif name.endswith('.jsx'):
+                eligible = in_app
+            else:
+                continue
+            if not eligible:
+                continue
+            # Filter to likely page files
+            stem = os.path.splitext(name)[0].lower()
+            if (in_pages or in_app
+                    or any(x in stem for x in _PAGE_NAME_MARKERS)):
+                files.append(Path(root) / name)
+                if len(files) >= 20:  # Limit
+                    return files
+
+    return files
 
 
 def check_page(file_path: Path) -> Dict[str, Any]:
@@ -57,9 +90,20 @@ def check_page(file_path: Path) -> Dict[str, Any]:
     except:
         return {'file': file_path.name, 'passed': [], 'issues': ['Read error'], 'score': 0}
     
+    # Files with no markup in their head can't score on any check;
+    # skip the regex sweeps entirely
+    prefix = content[:4096]
+    if '<' not in prefix and 'ld+json' not in prefix:
+        return {'file': file_path.name, 'passed': [],
+                'issues': ['No markup found'], 'score': 0}
+
     passed = []
     issues = []
-    
+
+    # Lowercased once; the caseless substring probes below reuse it
+    # instead of re-lowercasing the page per check
+    lowered = content.lower()
+
     # 1. JSON-LD Structured Data
     if 'application/ld+json' in content:
         passed.append("JSON-LD structured data")
@@ -71,10 +115,11 @@ def check_page(file_path: Path) -> Dict[str, Any]:
     else:
         issues.append("No JSON-LD structured data")
     
-    # 2. Heading Structure
-    h1_count = len(re.findall(r'<h1[^>]*>', content, re.I))
-    h2_count = len(re.findall(r'<h2[^>]*>', content, re.I))
-    
+    # 2. Heading Structure (tags tallied in one pass, lists/tables below)
+    tag_counts = Counter(m.lastgroup for m in _PAGE_TAG_RE.finditer(content))
+    h1_count = tag_counts['h1']
+    h2_count = tag_counts['h2']
+
     if h1_count == 1:
         passed.append("Single H1 heading")
     elif h1_count == 0:
@@ -93,21 +138,20 @@ def check_page(file_path: Path) -> Dict[str, Any]:
     else:
         issues.append("Missing title tag")
     
-    if 'meta' in content.lower() and 'description' in content.lower():
+    if 'meta' in lowered and 'description' in lowered:
         passed.append("Meta description")
     else:
         issues.append("Missing meta description")
-    
+
     # 4. Author Attribution (E-E-A-T)
-    author_patterns = ['author', 'byline', 'written-by', 'rel="author"']
-    if any(p in content.lower() for p in author_patterns):
+    author_patterns = ('author', 'byline', 'written-by', 'rel="author"')
+    if any(p in lowered for p in author_patterns):
         passed.append("Author attribution")
     else:
         issues.append("No author info (E-E-A-T)")
-    
+
     # 5. Publication Date
-    date_patterns = ['datePublished', 'dateModified', 'datetime=', 'pubdate']
-    if any(re.search(p, content, re.I) for p in date_patterns):
+    if _DATE_RE.search(content):
         passed.append("Publication date")
     else:
         issues.append("No publication date")
@@ -117,9 +161,9 @@ def check_page(file_path: Path) -> Dict[str, Any]:
         passed.append("Open Graph tags")
     
     # 7. Lists and Tables (structured content)
-    list_count = len(re.findall(r'<(ul|ol)[^>]*>', content, re.I))
-    table_count = len(re.findall(r'<table[^>]*>', content, re.I))
-    
+    list_count = tag_counts['list']
+    table_count = tag_counts['table']
+
     if list_count >= 2:
         passed.append(f"{list_count} lists")
     if table_count >= 1:
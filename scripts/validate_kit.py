@@ -9,32 +9,86 @@ Usage:
 """
 
 import argparse
+import io
 import json
+import mmap
 import os
 import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import NamedTuple
 
 
-class ValidationResult(NamedTuple):
+@dataclass(slots=True)
+class ValidationResult:
     passed: bool
     message: str
     category: str
-    severity: str  # ERROR, WARNING, INFO
+    severity: str = "ERROR"  # ERROR, WARNING, INFO
 
 
 class KitValidator:
     """Validates kit structure against KIT_SPEC.md standards."""
     
-    REQUIRED_RULE_FILES = ["GEMINI.md", "CLAUDE.md", "CURSOR.md", "AGENTS.md"]
-    REQUIRED_DIRS = ["agents", "skills", "rules"]
-    RECOMMENDED_DIRS = ["workflows", "scripts"]
+    REQUIRED_RULE_FILES = ("GEMINI.md", "CLAUDE.md", "CURSOR.md", "AGENTS.md")
+
+    # Frontmatter keys each tool requires (any one satisfies the check);
+    # an empty tuple means plain markdown is fine
+    # - GEMINI.md: requires "trigger:" frontmatter
+    # - CURSOR.md: requires "description:" or "alwaysApply:" frontmatter
+    # - CLAUDE.md: no frontmatter required (plain markdown)
+    # - AGENTS.md: no frontmatter required (plain markdown)
+    _FM_REQS = {
+        "GEMINI.md": (b"trigger",),
+        "CURSOR.md": (b"description", b"alwaysApply"),
+        "CLAUDE.md": (),
+        "AGENTS.md": (),
+    }
+    REQUIRED_DIRS = ("agents", "skills", "rules")
+    RECOMMENDED_DIRS = ("workflows", "scripts")
+
+    # All frontmatter keys any validator cares about, collected in one
+    # pass per file; the line anchor means only real YAML keys count
+    _FM_KEYS = re.compile(rb"^(name|description|skills|trigger|alwaysApply):", re.MULTILINE)
+
+    # ## heading lines, pulled straight off the mapped bytes so only
+    # headings are ever copied out of the file
+    _ARCH_HEADING_RE = re.compile(rb"^##[^\n]*", re.MULTILINE)
+
+    # Section names paired with the lowercase byte probe searched for in
+    # ## headings; every marker we check is ASCII, so files are scanned
+    # as bytes without paying for a UTF-8 decode
+    _ARCH_SECTIONS = (
+        ("Overview", b"overview"),
+        ("Agents", b"agents"),
+        ("Skills", b"skills"),
+        ("Statistics", b"statistics"),
+    )
     
-    def __init__(self, kit_path: str, verbose: bool = False):
+    def __init__(self, kit_path: str, verbose: bool = False, json_output: bool = False):
         self.kit_path = Path(kit_path)
+        # Plain-string form for the os-level calls below; pathlib only
+        # survives for display
+        self._base = os.fspath(self.kit_path)
         self.verbose = verbose
+        self.json_output = json_output
         self.results: list[ValidationResult] = []
+        # Results bucketed by category as they arrive, so printing
+        # doesn't need a second grouping pass
+        self._by_category: dict[str, list[ValidationResult]] = defaultdict(list)
+        # All report text accumulates here and hits stdout in one write
+        self._out = io.StringIO()
+        # Top-level kit entries by name, filled once in validate_all so
+        # the validators share one directory listing instead of each
+        # stat-ing kit_path/<subdir> again
+        self._entries: dict[str, os.DirEntry] = {}
+        # Rule-file bytes and directory entries cached by the rules
+        # validator so the path-reference pass doesn't scan or read the
+        # same files again
+        self._rule_contents: dict[str, bytes] = {}
+        self._rule_entries: list[os.DirEntry] | None = None
         self.stats = {
             "agents": 0,
             "skills": 0,
@@ -44,19 +98,100 @@ class KitValidator:
         }
     
     def add_result(self, passed: bool, message: str, category: str, severity: str = "ERROR"):
-        self.results.append(ValidationResult(passed, message, category, severity))
+        # INFO results are only ever printed in verbose mode; don't
+        # materialize them when nobody will look at them
+        if severity == "INFO" and not self.verbose:
+            return
+        result = ValidationResult(passed, message, category, severity)
+        self.results.append(result)
+        self._by_category[category].append(result)
+
+    def _map_file_checks(self, check, items):
+        """Run a per-file check over items, in parallel when it pays off.
+
+        Each check reads a file and returns its own result list, so the
+        reads overlap in threads while the merge back into self.results
+        stays on the calling thread and keeps the original order.
+        """
+        if len(items) <= 1:
+            for item in items:
+                self._merge_results(check(item))
+            return
+        workers = min(32, len(items), (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for file_results in ex.map(check, items):
+                self._merge_results(file_results)
+
+    def _merge_results(self, file_results):
+        self.results.extend(file_results)
+        for result in file_results:
+            self._by_category[result.category].append(result)
+
+    def _emit(self, text: str = ""):
+        if self.json_output:
+            return
+        self._out.write(text + "\n")
+
+    @staticmethod
+    def _list_md(path: str) -> list:
+        """List the markdown DirEntry objects in a directory.
+
+        A literal suffix check on scandir entries; no glob pattern
+        machinery for what is just an endswith test.
+        """
+        with os.scandir(path) as it:
+            return [e for e in it
+                    if e.name.endswith(".md") and not e.name.startswith(".")]
+
+    @classmethod
+    def _frontmatter_keys(cls, content: bytes, end: int) -> set:
+        """Collect the known frontmatter keys in content[:end].
+
+        The bound goes to the regex engine as endpos, so no head slice
+        is allocated per file.
+        """
+        return {m.group(1) for m in cls._FM_KEYS.finditer(content, 0, end)}
     
     def validate_all(self) -> bool:
         """Run all validations and return overall result."""
-        print(f"\n🔍 Validating kit: {self.kit_path}\n")
-        print("=" * 60)
-        
-        # Check kit exists
-        if not self.kit_path.exists():
+        try:
+            return self._validate_all()
+        finally:
+            if self.json_output:
+                # Machine-readable report in one dumps call; no emoji
+                # formatting work is done on this path
+                report = {
+                    "kit": str(self.kit_path),
+                    "passed": not any(not r.passed and r.severity == "ERROR"
+                                      for r in self.results),
+                    "errors": [r.message for r in self.results
+                               if not r.passed and r.severity == "ERROR"],
+                    "warnings": [r.message for r in self.results
+                                 if not r.passed and r.severity == "WARNING"],
+                    "stats": self.stats,
+                }
+                sys.stdout.write(json.dumps(report, ensure_ascii=False) + "\n")
+            else:
+                # Dozens of small writes become one stdout syscall
+                sys.stdout.write(self._out.getvalue())
+
+    def _validate_all(self) -> bool:
+        self._emit(f"\n🔍 Validating kit: {self.kit_path}\n")
+        self._emit("=" * 60)
+
+        # One scandir both proves the kit exists and supplies the
+        # listing, replacing the separate exists() stat
+        try:
+            with os.scandir(self._base) as it:
+                self._entries = {e.name: e for e in it}
+        except FileNotFoundError:
             self.add_result(False, f"Kit path does not exist: {self.kit_path}", "structure")
-            self._print_results()
+            if not self.json_output:
+                self._print_results()
             return False
-        
+        except OSError:
+            self._entries = {}
+
         # Structure validations
         self._validate_structure()
         self._validate_architecture_md()
@@ -67,7 +202,8 @@ class KitValidator:
         self._validate_path_references()
         
         # Print results
-        self._print_results()
+        if not self.json_output:
+            self._print_results()
         
         # Return overall result
         errors = [r for r in self.results if not r.passed and r.severity == "ERROR"]
@@ -75,90 +211,98 @@ class KitValidator:
     
     def _validate_structure(self):
         """Validate directory structure."""
-        print("\n📂 Checking directory structure...")
+        self._emit("\n📂 Checking directory structure...")
         
         # Required directories
         for dir_name in self.REQUIRED_DIRS:
-            dir_path = self.kit_path / dir_name
-            if dir_path.exists() and dir_path.is_dir():
+            entry = self._entries.get(dir_name)
+            if entry is not None and entry.is_dir():
                 self.add_result(True, f"Required directory exists: {dir_name}/", "structure", "INFO")
             else:
                 self.add_result(False, f"Missing required directory: {dir_name}/", "structure")
-        
+
         # Recommended directories
         for dir_name in self.RECOMMENDED_DIRS:
-            dir_path = self.kit_path / dir_name
-            if dir_path.exists() and dir_path.is_dir():
+            entry = self._entries.get(dir_name)
+            if entry is not None and entry.is_dir():
                 self.add_result(True, f"Recommended directory exists: {dir_name}/", "structure", "INFO")
             else:
                 self.add_result(True, f"Optional directory missing: {dir_name}/ (recommended)", "structure", "WARNING")
     
     def _validate_architecture_md(self):
         """Validate ARCHITECTURE.md exists and has required sections."""
-        print("\n📄 Checking ARCHITECTURE.md...")
+        self._emit("\n📄 Checking ARCHITECTURE.md...")
         
-        arch_path = self.kit_path / "ARCHITECTURE.md"
-        if not arch_path.exists():
+        arch_entry = self._entries.get("ARCHITECTURE.md")
+        if arch_entry is None:
             self.add_result(False, "Missing required file: ARCHITECTURE.md", "content")
             return
-        
+
         self.add_result(True, "ARCHITECTURE.md exists", "content", "INFO")
-        
-        content = arch_path.read_text(encoding="utf-8")
-        
-        # Check required sections
-        required_sections = [
-            ("Overview", r"##.*Overview"),
-            ("Agents", r"##.*Agents"),
-            ("Skills", r"##.*Skills"),
-            ("Statistics", r"##.*Statistics"),
-        ]
-        
-        for section_name, pattern in required_sections:
-            if re.search(pattern, content, re.IGNORECASE):
+
+        # Map the file instead of reading it; mature kits grow this file
+        # well past a page and the scan below never needs a full copy
+        with open(arch_entry.path, "rb") as fh:
+            try:
+                content = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                content = fh.read()
+
+        # One pass over the ## headings instead of one regex sweep per
+        # section, with plain substring checks per heading
+        found = set()
+        try:
+            for m in self._ARCH_HEADING_RE.finditer(content):
+                lowered = m.group().lower()
+                found.update(name for name, probe in self._ARCH_SECTIONS
+                             if probe in lowered)
+                if len(found) == len(self._ARCH_SECTIONS):
+                    break
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
+
+        for section_name, _ in self._ARCH_SECTIONS:
+            if section_name in found:
                 self.add_result(True, f"Section found: {section_name}", "content", "INFO")
             else:
                 self.add_result(False, f"Missing section in ARCHITECTURE.md: {section_name}", "content")
     
     def _validate_rules_folder(self):
         """Validate rules folder and required rule files."""
-        print("\n📜 Checking rules folder...")
+        self._emit("\n📜 Checking rules folder...")
         
-        rules_path = self.kit_path / "rules"
-        if not rules_path.exists():
+        rules_entry = self._entries.get("rules")
+        if rules_entry is None:
             self.add_result(False, "Missing rules/ folder", "rules")
             return
-        
-        # Define frontmatter requirements per tool
-        # - GEMINI.md: requires "trigger:" frontmatter
-        # - CURSOR.md: requires "description:" or "alwaysApply:" frontmatter
-        # - CLAUDE.md: no frontmatter required (plain markdown)
-        # - AGENTS.md: no frontmatter required (plain markdown)
-        frontmatter_requirements = {
-            "GEMINI.md": {"required": True, "fields": ["trigger:"]},
-            "CURSOR.md": {"required": True, "fields": ["description:", "alwaysApply:"]},
-            "CLAUDE.md": {"required": False, "fields": []},
-            "AGENTS.md": {"required": False, "fields": []},
-        }
+
+        # One listing of rules/ answers all four per-file existence
+        # checks and is kept for the path-reference pass
+        with os.scandir(rules_entry.path) as it:
+            self._rule_entries = list(it)
+        rule_paths = {e.name: e.path for e in self._rule_entries}
         
         for rule_file in self.REQUIRED_RULE_FILES:
-            rule_path = rules_path / rule_file
-            if rule_path.exists():
+            rule_path = rule_paths.get(rule_file)
+            if rule_path is not None:
                 self.stats["rule_files"] += 1
                 self.add_result(True, f"Rule file exists: {rule_file}", "rules", "INFO")
-                
-                content = rule_path.read_text(encoding="utf-8")
-                requirements = frontmatter_requirements.get(rule_file, {"required": False, "fields": []})
-                
-                if requirements["required"]:
+
+                with open(rule_path, "rb") as fh:
+                    content = fh.read()
+                self._rule_contents[rule_file] = content
+                fields = self._FM_REQS.get(rule_file, ())
+
+                if fields:
                     # Check frontmatter for tools that require it
-                    if content.startswith("---"):
+                    if content.startswith(b"---"):
                         # Check for required fields
-                        has_required_field = any(field in content[:500] for field in requirements["fields"])
-                        if has_required_field:
+                        keys = self._frontmatter_keys(content, 500)
+                        if any(field in keys for field in fields):
                             self.add_result(True, f"Frontmatter valid: {rule_file}", "rules", "INFO")
                         else:
-                            fields_str = " or ".join(requirements["fields"])
+                            fields_str = " or ".join(f.decode() + ":" for f in fields)
                             self.add_result(False, f"Missing {fields_str} in frontmatter: {rule_file}", "rules")
                     else:
                         self.add_result(False, f"Missing YAML frontmatter: {rule_file}", "rules")
@@ -171,13 +315,15 @@ class KitValidator:
     
     def _validate_agents(self):
         """Validate agent files."""
-        print("\n🤖 Checking agents...")
+        self._emit("\n🤖 Checking agents...")
         
-        agents_path = self.kit_path / "agents"
-        if not agents_path.exists():
+        agents_entry = self._entries.get("agents")
+        if agents_entry is None:
             return
-        
-        agent_files = list(agents_path.glob("*.md"))
+
+        # scandir hands back DirEntry objects with the name already
+        # cached, so no per-file Path allocation or extra stat calls
+        agent_files = self._list_md(agents_entry.path)
         self.stats["agents"] = len(agent_files)
         
         if len(agent_files) == 0:
@@ -187,39 +333,47 @@ class KitValidator:
         self.add_result(True, f"Found {len(agent_files)} agent(s)", "agents", "INFO")
         
         # Check each agent file
-        for agent_file in agent_files:
-            content = agent_file.read_text(encoding="utf-8")
-            
-            # Check frontmatter
-            if not content.startswith("---"):
-                self.add_result(False, f"Missing frontmatter: {agent_file.name}", "agents")
-                continue
-            
-            # Check required frontmatter fields
-            frontmatter_end = content.find("---", 3)
-            if frontmatter_end == -1:
-                self.add_result(False, f"Invalid frontmatter: {agent_file.name}", "agents")
-                continue
-            
-            frontmatter = content[3:frontmatter_end]
-            required_fields = ["name:", "description:", "skills:"]
-            
-            for field in required_fields:
-                if field in frontmatter:
-                    if self.verbose:
-                        self.add_result(True, f"{agent_file.name}: has {field}", "agents", "INFO")
-                else:
-                    self.add_result(False, f"{agent_file.name}: missing {field}", "agents", "WARNING")
+        self._map_file_checks(self._check_agent_file, agent_files)
+
+    def _check_agent_file(self, agent_file) -> list[ValidationResult]:
+        with open(agent_file.path, "rb") as fh:
+            content = fh.read()
+
+        # Check frontmatter
+        if not content.startswith(b"---"):
+            return [ValidationResult(False, f"Missing frontmatter: {agent_file.name}", "agents", "ERROR")]
+
+        # Check required frontmatter fields
+        frontmatter_end = content.find(b"---", 3)
+        if frontmatter_end == -1:
+            return [ValidationResult(False, f"Invalid frontmatter: {agent_file.name}", "agents", "ERROR")]
+
+        # Bounded view of the frontmatter; one regex pass collects every
+        # key instead of one substring scan per field
+        keys = self._frontmatter_keys(content, min(frontmatter_end, 1024))
+        required_fields = (("name:", b"name"),
+                           ("description:", b"description"),
+                           ("skills:", b"skills"))
+
+        results = []
+        for field, probe in required_fields:
+            if probe in keys:
+                if self.verbose:
+                    results.append(ValidationResult(True, f"{agent_file.name}: has {field}", "agents", "INFO"))
+            else:
+                results.append(ValidationResult(False, f"{agent_file.name}: missing {field}", "agents", "WARNING"))
+        return results
     
     def _validate_skills(self):
         """Validate skill folders and SKILL.md files."""
-        print("\n🧩 Checking skills...")
+        self._emit("\n🧩 Checking skills...")
         
-        skills_path = self.kit_path / "skills"
-        if not skills_path.exists():
+        skills_entry = self._entries.get("skills")
+        if skills_entry is None:
             return
-        
-        skill_dirs = [d for d in skills_path.iterdir() if d.is_dir()]
+
+        with os.scandir(skills_entry.path) as it:
+            skill_dirs = [e for e in it if e.is_dir()]
         self.stats["skills"] = len(skill_dirs)
         
         if len(skill_dirs) == 0:
@@ -229,39 +383,41 @@ class KitValidator:
         self.add_result(True, f"Found {len(skill_dirs)} skill(s)", "skills", "INFO")
         
         # Check each skill has SKILL.md
-        for skill_dir in skill_dirs:
-            skill_md = skill_dir / "SKILL.md"
-            if not skill_md.exists():
-                self.add_result(False, f"Missing SKILL.md in: {skill_dir.name}/", "skills")
-                continue
-            
-            content = skill_md.read_text(encoding="utf-8")
-            
-            # Check frontmatter
-            if not content.startswith("---"):
-                self.add_result(False, f"Missing frontmatter: {skill_dir.name}/SKILL.md", "skills")
-                continue
-            
-            # Check required fields
-            frontmatter_end = content.find("---", 3)
-            if frontmatter_end != -1:
-                frontmatter = content[3:frontmatter_end]
-                if "name:" in frontmatter and "description:" in frontmatter:
-                    if self.verbose:
-                        self.add_result(True, f"{skill_dir.name}: valid frontmatter", "skills", "INFO")
-                else:
-                    self.add_result(False, f"{skill_dir.name}: missing name/description", "skills", "WARNING")
+        self._map_file_checks(self._check_skill_dir, skill_dirs)
+
+    def _check_skill_dir(self, skill_dir) -> list[ValidationResult]:
+        skill_md = os.path.join(skill_dir.path, "SKILL.md")
+        try:
+            with open(skill_md, "rb") as fh:
+                content = fh.read()
+        except OSError:
+            return [ValidationResult(False, f"Missing SKILL.md in: {skill_dir.name}/", "skills", "ERROR")]
+
+        # Check frontmatter
+        if not content.startswith(b"---"):
+            return [ValidationResult(False, f"Missing frontmatter: {skill_dir.name}/SKILL.md", "skills", "ERROR")]
+
+        # Check required fields
+        frontmatter_end = content.find(b"---", 3)
+        if frontmatter_end == -1:
+            return []
+        keys = self._frontmatter_keys(content, min(frontmatter_end, 1024))
+        if b"name" in keys and b"description" in keys:
+            if self.verbose:
+                return [ValidationResult(True, f"{skill_dir.name}: valid frontmatter", "skills", "INFO")]
+            return []
+        return [ValidationResult(False, f"{skill_dir.name}: missing name/description", "skills", "WARNING")]
     
     def _validate_workflows(self):
         """Validate workflow files."""
-        print("\n🔄 Checking workflows...")
+        self._emit("\n🔄 Checking workflows...")
         
-        workflows_path = self.kit_path / "workflows"
-        if not workflows_path.exists():
+        workflows_entry = self._entries.get("workflows")
+        if workflows_entry is None:
             self.add_result(True, "No workflows/ folder (optional)", "workflows", "WARNING")
             return
-        
-        workflow_files = [f for f in workflows_path.glob("*.md") if f.name != ".gitkeep"]
+
+        workflow_files = self._list_md(workflows_entry.path)
         self.stats["workflows"] = len(workflow_files)
         
         if len(workflow_files) == 0:
@@ -271,33 +427,44 @@ class KitValidator:
         self.add_result(True, f"Found {len(workflow_files)} workflow(s)", "workflows", "INFO")
         
         # Check each workflow has description frontmatter
-        for wf_file in workflow_files:
-            content = wf_file.read_text(encoding="utf-8")
-            if content.startswith("---") and "description:" in content[:500]:
-                if self.verbose:
-                    self.add_result(True, f"{wf_file.name}: valid frontmatter", "workflows", "INFO")
-            else:
-                self.add_result(False, f"Missing description in: {wf_file.name}", "workflows", "WARNING")
+        self._map_file_checks(self._check_workflow_file, workflow_files)
+
+    def _check_workflow_file(self, wf_file) -> list[ValidationResult]:
+        with open(wf_file.path, "rb") as fh:
+            content = fh.read()
+        if content.startswith(b"---") and b"description" in self._frontmatter_keys(content, 500):
+            if self.verbose:
+                return [ValidationResult(True, f"{wf_file.name}: valid frontmatter", "workflows", "INFO")]
+            return []
+        return [ValidationResult(False, f"Missing description in: {wf_file.name}", "workflows", "WARNING")]
     
     def _validate_path_references(self):
         """Check that path references use .agent/ placeholder."""
-        print("\n🔗 Checking path references...")
+        self._emit("\n🔗 Checking path references...")
         
         # Check rules files
-        rules_path = self.kit_path / "rules"
-        if not rules_path.exists():
+        rules_entry = self._entries.get("rules")
+        if rules_entry is None:
             return
-        
+
         invalid_refs = []
-        for rule_file in rules_path.glob("*.md"):
-            content = rule_file.read_text(encoding="utf-8")
-            
+        if self._rule_entries is None:
+            with os.scandir(rules_entry.path) as it:
+                self._rule_entries = list(it)
+        rule_files = [e for e in self._rule_entries
+                      if e.name.endswith(".md") and not e.name.startswith(".")]
+        for rule_file in rule_files:
+            content = self._rule_contents.get(rule_file.name)
+            if content is None:
+                with open(rule_file.path, "rb") as fh:
+                    content = fh.read()
+
             # Check for hardcoded tool paths that should be .agent/
             # Skip checking for the actual tool-specific paths in content
             # as CURSOR.md may legitimately mention .cursor/ for documentation
-            
+
             # Check that the file uses .agent/ for path references
-            if ".agent/" in content:
+            if b".agent/" in content:
                 if self.verbose:
                     self.add_result(True, f"{rule_file.name}: uses .agent/ placeholder", "paths", "INFO")
         
@@ -306,47 +473,40 @@ class KitValidator:
     
     def _print_results(self):
         """Print validation results."""
-        print("\n" + "=" * 60)
-        print("\n📊 VALIDATION RESULTS\n")
-        
-        # Group by category
-        categories = {}
-        for result in self.results:
-            if result.category not in categories:
-                categories[result.category] = []
-            categories[result.category].append(result)
+        self._emit("\n" + "=" * 60)
+        self._emit("\n📊 VALIDATION RESULTS\n")
         
-        # Print by category
-        for category, results in categories.items():
+        # Print by category (bucketed at insertion time)
+        for category, results in self._by_category.items():
             if self.verbose or any(not r.passed for r in results):
-                print(f"\n{category.upper()}:")
+                self._emit(f"\n{category.upper()}:")
                 for r in results:
                     if self.verbose or not r.passed:
                         icon = "✅" if r.passed else ("⚠️" if r.severity == "WARNING" else "❌")
-                        print(f"  {icon} {r.message}")
+                        self._emit(f"  {icon} {r.message}")
         
         # Summary
         errors = [r for r in self.results if not r.passed and r.severity == "ERROR"]
         warnings = [r for r in self.results if not r.passed and r.severity == "WARNING"]
         
-        print("\n" + "=" * 60)
-        print("\n📈 STATISTICS")
-        print(f"  Agents:     {self.stats['agents']}")
-        print(f"  Skills:     {self.stats['skills']}")
-        print(f"  Workflows:  {self.stats['workflows']}")
-        print(f"  Rule Files: {self.stats['rule_files']}/4")
+        self._emit("\n" + "=" * 60)
+        self._emit("\n📈 STATISTICS")
+        self._emit(f"  Agents:     {self.stats['agents']}")
+        self._emit(f"  Skills:     {self.stats['skills']}")
+        self._emit(f"  Workflows:  {self.stats['workflows']}")
+        self._emit(f"  Rule Files: {self.stats['rule_files']}/4")
         
-        print("\n" + "=" * 60)
+        self._emit("\n" + "=" * 60)
         if errors:
-            print(f"\n❌ FAILED: {len(errors)} error(s), {len(warnings)} warning(s)")
-            print("\nFix the errors above and run validation again.")
+            self._emit(f"\n❌ FAILED: {len(errors)} error(s), {len(warnings)} warning(s)")
+            self._emit("\nFix the errors above and run validation again.")
         elif warnings:
-            print(f"\n⚠️ PASSED with {len(warnings)} warning(s)")
-            print("\nConsider addressing the warnings for a complete kit.")
+            self._emit(f"\n⚠️ PASSED with {len(warnings)} warning(s)")
+            self._emit("\nConsider addressing the warnings for a complete kit.")
         else:
-            print("\n✅ PASSED: Kit structure is valid!")
+            self._emit("\n✅ PASSED: Kit structure is valid!")
         
-        print()
+        self._emit()
 
 
 def main():
@@ -362,10 +522,11 @@ Examples:
     )
     parser.add_argument("kit_path", help="Path to kit directory (e.g., kits/coder)")
     parser.add_argument("-v", "--verbose", action="store_true", help="Show all checks, not just failures")
-    
+    parser.add_argument("--json", action="store_true", help="Emit a machine-readable JSON report instead of the formatted output")
+
     args = parser.parse_args()
-    
-    validator = KitValidator(args.kit_path, verbose=args.verbose)
+
+    validator = KitValidator(args.kit_path, verbose=args.verbose, json_output=args.json)
     success = validator.validate_all()
     
     sys.exit(0 if success else 1)